@@ -6,9 +6,39 @@ showing the three-layer architecture (top/middle/bottom).
 """
 
 import ast
+import hashlib
+import io
+import os
+import pickle
 import sys
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import NamedTuple
+from typing import NamedTuple, TextIO
+
+# Bump when the pickled AST layout or cache key scheme changes
+AST_CACHE_FORMAT_VERSION = 1
+
+# Directory and file names skipped while collecting sources; excluded directories
+# are never descended into
+EXCLUDED_NAMES = frozenset({"__pycache__"})
+EXCLUDED_PREFIXES = ("test",)
+
+# Maximum functions per layer subgraph, and public methods per class, shown in diagrams
+MAX_ITEMS_PER_GROUP = 5
+
+# Layer subgraphs in display order: (layer name, subgraph header, node class suffix)
+_LAYER_SECTIONS = (
+    ("top", '        subgraph "Top Layer (Entry Points)"\n', ""),
+    ("middle", '        subgraph "Middle Layer (Business Logic)"\n', ""),
+    ("bottom", '        subgraph "Bottom Layer (Utilities)"\n', ":::utility"),
+)
+_SUBGRAPH_END = "        end\n"
+
+# Below this many files, process-pool start-up costs more than parsing saves
+PARALLEL_MIN_FILES = 32
 
 
 class FunctionInfo(NamedTuple):
@@ -21,103 +51,308 @@ class FunctionInfo(NamedTuple):
     complexity: int  # Simple estimate based on statements
 
 
-class CodeAnalyzer:
-    """Analyze Python code structure."""
+def _iter_py_files(root_dir: Path):
+    """Yield paths of non-test Python files under a directory.
 
-    def __init__(self, root_dir: Path):
-        """Initialize analyzer.
+    Test and __pycache__ directories are pruned before descending, and the
+    file-type checks reuse the DirEntry data from scandir() instead of
+    issuing a stat() per entry.
+
+    Args:
+        root_dir: Directory to search.
+
+    Yields:
+        Path strings of matching .py files.
+    """
+    stack = [str(root_dir)]
+    while stack:
+        # Like rglob(), silently skip missing or unreadable directories
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                name = entry.name
+                if name in EXCLUDED_NAMES or name.startswith(EXCLUDED_PREFIXES):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif name.endswith(".py") and entry.is_file():
+                    yield entry.path
+
+
+def _is_trivial_body(body: list[ast.stmt]) -> bool:
+    """Check whether a function body is a lone pass, or a return/expression of a plain value.
+
+    Args:
+        body: Statements of a function body.
+
+    Returns:
+        True if the body is ``pass``, or returns/evaluates nothing, a name, a constant,
+        or an attribute of a name.
+    """
+    if len(body) != 1:
+        return False
+
+    stmt = body[0]
+    if isinstance(stmt, ast.Pass):
+        return True
+    if not isinstance(stmt, (ast.Return, ast.Expr)):
+        return False
+
+    value = stmt.value
+    if isinstance(value, ast.Attribute):
+        value = value.value
+    return value is None or isinstance(value, (ast.Name, ast.Constant))
+
+
+class _ModuleVisitor(ast.NodeVisitor):
+    """Collect functions and classes from a module AST in a single traversal.
+
+    Calls and complexity (node count) are accumulated for every enclosing
+    function while descending, so each node is visited exactly once.
+    """
+
+    def __init__(self, module_name: str):
+        """Initialize visitor.
 
         Args:
-            root_dir: Root directory of the codebase.
+            module_name: Dotted module name recorded on every result.
         """
-        self.root_dir = root_dir
-        self.functions = []
+        self.module_name = module_name
         self.classes = {}
+        self._functions = []  # (depth, order, FunctionInfo)
+        self._method_ids = set()  # id() of every FunctionDef directly in a class body
+        self._open = []  # (calls, [node_count]) for each enclosing function
+        self._depth = 0
+        self._order = 0
 
-    def analyze(self):
-        """Analyze all Python files in the codebase."""
-        # Find all Python files
-        py_files = list(self.root_dir.rglob("*.py"))
-        py_files = [f for f in py_files if "test" not in str(f) and "__pycache__" not in str(f)]
+    def get_functions(self) -> list[FunctionInfo]:
+        """Get collected functions in breadth-first order, matching ast.walk().
 
-        for py_file in py_files:
-            self._analyze_file(py_file)
+        Returns:
+            List of FunctionInfo.
+        """
+        return [info for _depth, _order, info in sorted(self._functions, key=lambda t: t[:2])]
 
-    def _analyze_file(self, file_path: Path):
-        """Analyze a single Python file.
+    def visit(self, node):
+        """Visit a node, counting it toward every enclosing function."""
+        for _calls, count in self._open:
+            count[0] += 1
 
-        Args:
-            file_path: Path to the Python file.
-        """
+        self._depth += 1
         try:
-            with open(file_path, encoding="utf-8") as f:
-                tree = ast.parse(f.read(), filename=str(file_path))
-        except Exception as e:
-            print(f"Warning: Could not parse {file_path}: {e}", file=sys.stderr)
-            return
+            return super().visit(node)
+        finally:
+            self._depth -= 1
+
+    def _visit_fields(self, node: ast.AST, skip: str):
+        """Visit the children of a node like generic_visit(), except for one field."""
+        for field, value in ast.iter_fields(node):
+            if field == skip:
+                continue
+            if isinstance(value, list):
+                for item in value:
+                    if isinstance(item, ast.AST):
+                        self.visit(item)
+            elif isinstance(value, ast.AST):
+                self.visit(value)
+
+    def visit_Call(self, node: ast.Call):
+        """Record the called name for every enclosing function."""
+        if isinstance(node.func, ast.Name):
+            name = node.func.id
+        elif isinstance(node.func, ast.Attribute):
+            name = node.func.attr
+        else:
+            name = None
+
+        if name is not None:
+            for calls, _count in self._open:
+                calls.append(name)
+
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        """Record a class and its direct methods."""
+        methods = [m for m in node.body if isinstance(m, ast.FunctionDef)]
+        self._method_ids.update(id(m) for m in methods)
+        self.classes[node.name] = {
+            "module": self.module_name,
+            "methods": [m.name for m in methods],
+        }
+
+        self.generic_visit(node)
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        """Record a function along with its calls and complexity."""
+        # Class bodies are visited before their children, so methods are already known
+        is_method = id(node) in self._method_ids
+
+        depth, order = self._depth, self._order
+        self._order += 1
+
+        calls = []
+        count = [1]  # Include the FunctionDef node itself
+        self._open.append((calls, count))
+        if _is_trivial_body(node.body):
+            # Nothing in a trivial body can call or define anything, so just count its nodes
+            body_nodes = sum(1 for _ in ast.walk(node.body[0]))
+            for _calls, enclosing_count in self._open:
+                enclosing_count[0] += body_nodes
+            self._visit_fields(node, skip="body")
+        else:
+            self.generic_visit(node)
+        self._open.pop()
+
+        func_info = FunctionInfo(
+            name=node.name,
+            module=self.module_name,
+            is_method=is_method,
+            calls=calls,
+            complexity=count[0],
+        )
+        self._functions.append((depth, order, func_info))
+
+
+def _load_tree(file_path: Path, cache_dir: Path | None) -> ast.Module:
+    """Parse a file, reusing a cached AST when the source is unchanged.
+
+    Cache entries are keyed by the SHA-256 of the source bytes, the Python
+    version and AST_CACHE_FORMAT_VERSION.
+
+    Args:
+        file_path: Path to the Python file.
+        cache_dir: Directory for the parsed-AST cache. If None, caching is disabled.
+
+    Returns:
+        Parsed module AST.
+    """
+    # ast.parse() accepts bytes and honours any coding cookie, so skip text-mode decoding
+    data = file_path.read_bytes()
+
+    if cache_dir is None:
+        return ast.parse(data, filename=str(file_path))
+
+    key = hashlib.sha256(data)
+    key.update(f"{sys.version_info[:3]}:{AST_CACHE_FORMAT_VERSION}".encode())
+    cache_file = cache_dir / f"{key.hexdigest()}.pkl"
+
+    try:
+        with open(cache_file, "rb") as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Warning: Ignoring corrupt AST cache {cache_file}: {e}", file=sys.stderr)
+
+    tree = ast.parse(data, filename=str(file_path))
+
+    # Write atomically so concurrent or interrupted runs never leave a partial entry
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(tree, f, protocol=5)
+            os.replace(tmp_path, cache_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        print(f"Warning: Could not write AST cache {cache_file}: {e}", file=sys.stderr)
 
-        module_name = self._get_module_name(file_path)
+    return tree
 
-        for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef):
-                # Check if it's a method or standalone function
-                parent = self._get_parent_class(tree, node)
-                is_method = parent is not None
 
-                # Extract function calls
-                calls = self._extract_calls(node)
+def _get_module_name(file_path: str, root_prefix: str) -> str:
+    """Get module name from file path.
 
-                # Estimate complexity
-                complexity = len(list(ast.walk(node)))
+    Args:
+        file_path: Path to the Python file, as yielded by _iter_py_files().
+        root_prefix: Root directory of the codebase, ending with a path separator.
 
-                func_info = FunctionInfo(
-                    name=node.name,
-                    module=module_name,
-                    is_method=is_method,
-                    calls=calls,
-                    complexity=complexity,
-                )
-                self.functions.append(func_info)
+    Returns:
+        Module name (e.g., 'docfiler.config').
+    """
+    module = file_path[len(root_prefix):].removesuffix(".py").replace(os.sep, ".")
+    if module == "__init__":
+        return ""
+    return module.removesuffix(".__init__")
 
-            elif isinstance(node, ast.ClassDef):
-                self.classes[node.name] = {
-                    "module": module_name,
-                    "methods": [m.name for m in node.body if isinstance(m, ast.FunctionDef)],
-                }
 
-    def _get_module_name(self, file_path: Path) -> str:
-        """Get module name from file path.
+def _analyze_file(file_path: str, root_prefix: str, cache_dir: Path | None):
+    """Analyze a single Python file.
+
+    This is a module-level function with no shared state so that it can run
+    in a worker process.
+
+    Args:
+        file_path: Path to the Python file.
+        root_prefix: Root directory of the codebase, ending with a path separator.
+        cache_dir: Directory for the parsed-AST cache. If None, caching is disabled.
+
+    Returns:
+        Tuple of (list of FunctionInfo, dict of class name -> class info).
+    """
+    try:
+        tree = _load_tree(Path(file_path), cache_dir)
+    except Exception as e:
+        print(f"Warning: Could not parse {file_path}: {e}", file=sys.stderr)
+        return [], {}
+
+    visitor = _ModuleVisitor(_get_module_name(file_path, root_prefix))
+    visitor.visit(tree)
+
+    return visitor.get_functions(), visitor.classes
+
+
+class CodeAnalyzer:
+    """Analyze Python code structure."""
+
+    def __init__(self, root_dir: Path, cache_dir: Path | None = None):
+        """Initialize analyzer.
 
         Args:
-            file_path: Path to the Python file.
+            root_dir: Root directory of the codebase.
+            cache_dir: Directory for the parsed-AST cache. If None, caching is disabled.
+        """
+        self.root_dir = root_dir
+        self.cache_dir = cache_dir
+        self.functions = []
+        self.classes = {}
 
-        Returns:
-            Module name (e.g., 'docfiler.config').
+    def analyze(self):
+        """Analyze all Python files in the codebase.
+
+        Files are parsed in a process pool once there are enough of them to
+        amortize the worker start-up cost.
         """
-        rel_path = file_path.relative_to(self.root_dir)
-        parts = list(rel_path.parts[:-1]) + [rel_path.stem]
-        if parts[-1] == "__init__":
-            parts = parts[:-1]
-        return ".".join(parts)
-
-    def _get_parent_class(self, tree, func_node):
-        """Get parent class of a function if it's a method."""
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                if func_node in node.body:
-                    return node.name
-        return None
-
-    def _extract_calls(self, func_node) -> list[str]:
-        """Extract function calls from a function."""
-        calls = []
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Call):
-                if isinstance(node.func, ast.Name):
-                    calls.append(node.func.id)
-                elif isinstance(node.func, ast.Attribute):
-                    calls.append(node.func.attr)
-        return calls
+        py_files = list(_iter_py_files(self.root_dir))
+        # scandir() paths are built by joining onto str(root_dir), so a prefix slice is exact
+        root_prefix = os.path.join(str(self.root_dir), "")
+        worker = partial(_analyze_file, root_prefix=root_prefix, cache_dir=self.cache_dir)
+
+        if len(py_files) < PARALLEL_MIN_FILES:
+            self._merge_results(map(worker, py_files))
+            return
+
+        cpu_count = os.cpu_count() or 1
+        chunksize = max(1, len(py_files) // (4 * cpu_count))
+        with ProcessPoolExecutor() as executor:
+            self._merge_results(executor.map(worker, py_files, chunksize=chunksize))
+
+    def _merge_results(self, results):
+        """Merge per-file analysis results in file order.
+
+        Args:
+            results: Iterable of (functions, classes) tuples.
+        """
+        for functions, classes in results:
+            self.functions.extend(functions)
+            self.classes.update(classes)
 
     def categorize_by_layer(self) -> dict:
         """Categorize functions into top/middle/bottom layers.
@@ -145,6 +380,42 @@ class CodeAnalyzer:
         return layers
 
 
+class _Tee:
+    """Write-only text stream that forwards to several streams."""
+
+    def __init__(self, *streams: TextIO):
+        """Initialize tee.
+
+        Args:
+            streams: Streams that receive every write.
+        """
+        self.streams = streams
+
+    def write(self, text: str):
+        """Write text to every stream."""
+        for stream in self.streams:
+            stream.write(text)
+
+    def writelines(self, lines):
+        """Write each line to every stream."""
+        for line in lines:
+            self.write(line)
+
+
+def _render(write_diagram) -> str:
+    """Render a diagram writer to a string.
+
+    Args:
+        write_diagram: Callable taking a text stream.
+
+    Returns:
+        Diagram text without the trailing newline.
+    """
+    buffer = io.StringIO()
+    write_diagram(buffer)
+    return buffer.getvalue().removesuffix("\n")
+
+
 class MermaidGenerator:
     """Generate Mermaid diagrams from code analysis."""
 
@@ -162,9 +433,17 @@ class MermaidGenerator:
         Returns:
             Mermaid diagram as string.
         """
+        return _render(self.write_layer_diagram)
+
+    def write_layer_diagram(self, out: TextIO):
+        """Write layer architecture diagram.
+
+        Args:
+            out: Text stream to write the Mermaid diagram to.
+        """
         layers = self.analyzer.categorize_by_layer()
 
-        lines = ["```mermaid", "graph TB"]
+        out.write("```mermaid\ngraph TB\n")
 
         # Group by module
         modules = {}
@@ -180,40 +459,30 @@ class MermaidGenerator:
             if module in ("tests", "__pycache__"):
                 continue
 
-            lines.append(f'    subgraph "{module}"')
-
-            # Top layer
-            if module_layers["top"]:
-                lines.append('        subgraph "Top Layer (Entry Points)"')
-                for func in module_layers["top"][:5]:  # Limit to 5
-                    func_id = f"{module}_{func.name}".replace(".", "_")
-                    lines.append(f'            {func_id}["{func.name}()"]')
-                lines.append("        end")
-
-            # Middle layer
-            if module_layers["middle"]:
-                lines.append('        subgraph "Middle Layer (Business Logic)"')
-                for func in module_layers["middle"][:5]:  # Limit to 5
-                    func_id = f"{module}_{func.name}".replace(".", "_")
-                    lines.append(f'            {func_id}["{func.name}()"]')
-                lines.append("        end")
-
-            # Bottom layer
-            if module_layers["bottom"]:
-                lines.append('        subgraph "Bottom Layer (Utilities)"')
-                for func in module_layers["bottom"][:5]:  # Limit to 5
-                    func_id = f"{module}_{func.name}".replace(".", "_")
-                    lines.append(f'            {func_id}["{func.name}()"]:::utility')
-                lines.append("        end")
-
-            lines.append("    end")
-            lines.append("")
+            out.write(f'    subgraph "{module}"\n')
+
+            # Node ids only need the module part escaped; function names have no dots
+            id_prefix = module.replace(".", "_") + "_"
+
+            for layer_name, header, node_class in _LAYER_SECTIONS:
+                funcs = module_layers[layer_name][:MAX_ITEMS_PER_GROUP]
+                if not funcs:
+                    continue
+
+                out.write(header)
+                out.writelines(
+                    f'            {id_prefix}{func.name}["{func.name}()"]{node_class}\n'
+                    for func in funcs
+                )
+                out.write(_SUBGRAPH_END)
+
+            out.write("    end\n")
+            out.write("\n")
 
         # Add style
-        lines.append("    classDef utility fill:#e1f5ff,stroke:#01579b")
+        out.write("    classDef utility fill:#e1f5ff,stroke:#01579b\n")
 
-        lines.append("```")
-        return "\n".join(lines)
+        out.write("```\n")
 
     def generate_module_diagram(self) -> str:
         """Generate module-level architecture diagram.
@@ -221,7 +490,15 @@ class MermaidGenerator:
         Returns:
             Mermaid diagram as string.
         """
-        lines = ["```mermaid", "graph LR"]
+        return _render(self.write_module_diagram)
+
+    def write_module_diagram(self, out: TextIO):
+        """Write module-level architecture diagram.
+
+        Args:
+            out: Text stream to write the Mermaid diagram to.
+        """
+        out.write("```mermaid\ngraph LR\n")
 
         # Group functions by module
         modules = {}
@@ -231,6 +508,9 @@ class MermaidGenerator:
                 modules[module] = []
             modules[module].append(func)
 
+        # Count classes per module in one pass
+        class_counts = Counter(info["module"] for info in self.analyzer.classes.values())
+
         # Add module nodes
         for module in sorted(modules.keys()):
             if "test" in module or "__pycache__" in module:
@@ -239,15 +519,14 @@ class MermaidGenerator:
             module_id = module.replace(".", "_")
             # Count functions in module
             func_count = len(modules[module])
-            class_count = len([c for c, info in self.analyzer.classes.items()
-                              if info["module"] == module])
+            class_count = class_counts[module]
 
             label = f"{module}\\n({func_count} funcs, {class_count} classes)"
-            lines.append(f'    {module_id}["{label}"]')
+            out.write(f'    {module_id}["{label}"]\n')
 
         # Add relationships based on imports (simplified)
-        lines.append("")
-        lines.append("    %% Module relationships")
+        out.write("\n")
+        out.write("    %% Module relationships\n")
 
         # Identify core modules
         core_modules = ["docfiler.config", "docfiler.api_clients",
@@ -261,9 +540,9 @@ class MermaidGenerator:
                 if "docfiler.gui" in modules or "docfiler.cli" in modules:
                     if core_module in ["docfiler.vlm_service", "docfiler.image_processor"]:
                         if "docfiler.gui" in modules:
-                            lines.append(f"    docfiler_gui_main_window --> {core_id}")
+                            out.write(f"    docfiler_gui_main_window --> {core_id}\n")
                         if "docfiler.cli" in modules:
-                            lines.append(f"    docfiler_cli_context_generator --> {core_id}")
+                            out.write(f"    docfiler_cli_context_generator --> {core_id}\n")
 
                 # Services depend on config
                 if core_module == "docfiler.config":
@@ -271,10 +550,9 @@ class MermaidGenerator:
                                "docfiler.image_processor"]:
                         if svc in modules:
                             svc_id = svc.replace(".", "_")
-                            lines.append(f"    {svc_id} --> {core_id}")
+                            out.write(f"    {svc_id} --> {core_id}\n")
 
-        lines.append("```")
-        return "\n".join(lines)
+        out.write("```\n")
 
     def generate_class_diagram(self) -> str:
         """Generate class diagram.
@@ -282,42 +560,50 @@ class MermaidGenerator:
         Returns:
             Mermaid class diagram as string.
         """
-        lines = ["```mermaid", "classDiagram"]
+        return _render(self.write_class_diagram)
+
+    def write_class_diagram(self, out: TextIO):
+        """Write class diagram.
+
+        Args:
+            out: Text stream to write the Mermaid class diagram to.
+        """
+        out.write("```mermaid\nclassDiagram\n")
 
         # Add classes
         for class_name, info in sorted(self.analyzer.classes.items()):
             if "test" in info["module"].lower():
                 continue
 
-            lines.append(f"    class {class_name} {{")
+            out.write(f"    class {class_name} {{\n")
 
             # Add methods (limit to important ones)
             public_methods = [m for m in info["methods"] if not m.startswith("_")]
-            for method in public_methods[:5]:
-                lines.append(f"        +{method}()")
+            out.writelines(
+                f"        +{method}()\n" for method in public_methods[:MAX_ITEMS_PER_GROUP]
+            )
 
-            if len(public_methods) > 5:
-                lines.append(f"        +... ({len(public_methods) - 5} more)")
+            if len(public_methods) > MAX_ITEMS_PER_GROUP:
+                out.write(f"        +... ({len(public_methods) - MAX_ITEMS_PER_GROUP} more)\n")
 
-            lines.append("    }")
-            lines.append("")
+            out.write("    }\n")
+            out.write("\n")
 
         # Add relationships (simplified)
-        lines.append("    %% Relationships")
+        out.write("    %% Relationships\n")
 
         # VLMService uses ImageProcessor and APIClient
         if "VLMService" in self.analyzer.classes:
             if "ImageProcessor" in self.analyzer.classes:
-                lines.append("    VLMService --> ImageProcessor : uses")
+                out.write("    VLMService --> ImageProcessor : uses\n")
             if "ClaudeClient" in self.analyzer.classes:
-                lines.append("    VLMService --> VLMClient : uses")
+                out.write("    VLMService --> VLMClient : uses\n")
 
         # GUI uses VLMService
         if "MainWindow" in self.analyzer.classes and "VLMService" in self.analyzer.classes:
-            lines.append("    MainWindow --> VLMService : uses")
+            out.write("    MainWindow --> VLMService : uses\n")
 
-        lines.append("```")
-        return "\n".join(lines)
+        out.write("```\n")
 
 
 def main():
@@ -328,54 +614,38 @@ def main():
 
     # Analyze codebase
     print("Analyzing codebase...")
-    analyzer = CodeAnalyzer(project_root / "docfiler")
+    analyzer = CodeAnalyzer(
+        project_root / "docfiler",
+        cache_dir=project_root / ".cache" / "source-ast-cache",
+    )
     analyzer.analyze()
 
     print(f"Found {len(analyzer.functions)} functions and {len(analyzer.classes)} classes")
 
-    # Generate diagrams
+    # Generate diagrams, streaming each one to the console and the output file
     generator = MermaidGenerator(analyzer)
+    sections = [
+        ("LAYER ARCHITECTURE DIAGRAM", "Layer Architecture", generator.write_layer_diagram),
+        ("MODULE ARCHITECTURE DIAGRAM", "Module Architecture", generator.write_module_diagram),
+        ("CLASS DIAGRAM", "Class Diagram", generator.write_class_diagram),
+    ]
 
-    # Generate layer diagram
-    print("\n" + "=" * 50)
-    print("LAYER ARCHITECTURE DIAGRAM")
-    print("=" * 50)
-    layer_diagram = generator.generate_layer_diagram()
-    print(layer_diagram)
-
-    # Generate module diagram
-    print("\n" + "=" * 50)
-    print("MODULE ARCHITECTURE DIAGRAM")
-    print("=" * 50)
-    module_diagram = generator.generate_module_diagram()
-    print(module_diagram)
-
-    # Generate class diagram
-    print("\n" + "=" * 50)
-    print("CLASS DIAGRAM")
-    print("=" * 50)
-    class_diagram = generator.generate_class_diagram()
-    print(class_diagram)
-
-    # Save to file
     output_file = project_root / "llms" / "architecture_diagrams.md"
-    with open(output_file, "w", encoding="utf-8") as f:
+    with open(output_file, "w", encoding="utf-8", buffering=1 << 16) as f:
         f.write("# Auto-Generated Architecture Diagrams\n\n")
         f.write("> Generated by scripts/generate_architecture_diagram.py\n\n")
         f.write(f"> Total: {len(analyzer.functions)} functions, {len(analyzer.classes)} classes\n\n")
-        f.write("---\n\n")
-
-        f.write("## Layer Architecture\n\n")
-        f.write(layer_diagram)
-        f.write("\n\n---\n\n")
 
-        f.write("## Module Architecture\n\n")
-        f.write(module_diagram)
-        f.write("\n\n---\n\n")
+        for index, (console_title, file_title, write_diagram) in enumerate(sections):
+            print("\n" + "=" * 50)
+            print(console_title)
+            print("=" * 50)
 
-        f.write("## Class Diagram\n\n")
-        f.write(class_diagram)
-        f.write("\n")
+            # Blank line between the previous diagram and the next separator
+            if index:
+                f.write("\n")
+            f.write(f"---\n\n## {file_title}\n\n")
+            write_diagram(_Tee(sys.stdout, f))
 
     print(f"\n✅ Diagrams saved to {output_file}")
 
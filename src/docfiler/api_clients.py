@@ -3,17 +3,100 @@
 This module provides a unified interface to Claude, OpenAI, and Gemini APIs.
 """
 
-import base64
+import hashlib
 import json
 import logging
+import re
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from functools import cache
 
 import anthropic
 from google import genai
 from openai import OpenAI
 
+# Prefer the accelerated encoder and parser when installed (docfiler[speedups])
+try:
+    from pybase64 import b64encode as _b64encode
+except ImportError:
+    from base64 import standard_b64encode as _b64encode
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 logger = logging.getLogger(__name__)
 
+# Markdown code fence (```json or ```) around a model response; the closing fence is optional
+_CODE_FENCE_RE = re.compile(r"^```(?:json)?(.*?)(?:```)?$", re.DOTALL)
+
+# Encoded pages kept per client for re-sends; only the base64 text is held, keyed by digest
+B64_CACHE_SIZE = 4
+
+
+class _Base64Cache:
+    """Small LRU of base64-encoded pages keyed by a digest of the image bytes.
+
+    Keying on a digest instead of the bytes themselves means the raw PNG data is not
+    kept alive by the cache.
+    """
+
+    def __init__(self, maxsize: int = B64_CACHE_SIZE):
+        self._maxsize = maxsize
+        self._entries: OrderedDict[bytes, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def encode(self, img_bytes: bytes) -> str:
+        """Base64-encode image data, reusing the result for a recently sent page.
+
+        Args:
+            img_bytes: Image data as bytes.
+
+        Returns:
+            Base64 string.
+        """
+        key = hashlib.blake2b(img_bytes, digest_size=16).digest()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                self._entries.move_to_end(key)
+                return cached
+
+        encoded = _b64encode(img_bytes).decode("ascii")
+        with self._lock:
+            self._entries[key] = encoded
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+        return encoded
+
+
+def _parse_json_response(response_text: str) -> dict:
+    """Parse JSON from model response.
+
+    Args:
+        response_text: Raw text response from the model.
+
+    Returns:
+        Parsed JSON dictionary.
+
+    Raises:
+        ValueError: If response cannot be parsed as JSON.
+    """
+    # Try to extract JSON from markdown code blocks if present
+    text = response_text.strip()
+    match = _CODE_FENCE_RE.match(text)
+    if match:
+        text = match.group(1).strip()
+
+    try:
+        result = _json_loads(text)
+        return result
+    except json.JSONDecodeError as e:
+        logger.error(f"Failed to parse JSON response: {text}")
+        raise ValueError(f"Invalid JSON response: {e}") from e
+
 
 class VLMClient(ABC):
     """Abstract base class for VLM API clients."""
@@ -34,6 +117,19 @@ class VLMClient(ABC):
         """
         pass
 
+    @abstractmethod
+    def generate_text(self, prompt: str, max_tokens: int = 1024) -> str:
+        """Generate a text-only completion.
+
+        Args:
+            prompt: The prompt text to send to the model.
+            max_tokens: Maximum number of tokens to generate.
+
+        Returns:
+            The model's text response.
+        """
+        pass
+
 
 class ClaudeClient(VLMClient):
     """Client for Anthropic's Claude API."""
@@ -47,6 +143,7 @@ class ClaudeClient(VLMClient):
         """
         self.client = anthropic.Anthropic(api_key=api_key)
         self.model = model
+        self._b64_cache = _Base64Cache()
 
     def analyze_document(self, prompt: str, images: list[bytes], max_tokens: int = 1024) -> dict:
         """Analyze document images with Claude.
@@ -60,19 +157,15 @@ class ClaudeClient(VLMClient):
         """
         logger.info(f"Sending request to Claude ({self.model})")
 
-        # Build content array with images and prompt
+        # Build content array with images
         content = []
-
-        for _idx, img_bytes in enumerate(images):
-            # Encode image as base64
-            img_b64 = base64.standard_b64encode(img_bytes).decode("utf-8")
-
+        for img_bytes in images:
             content.append({
                 "type": "image",
                 "source": {
                     "type": "base64",
                     "media_type": "image/png",
-                    "data": img_b64,
+                    "data": self._b64_cache.encode(img_bytes),
                 },
             })
 
@@ -94,42 +187,24 @@ class ClaudeClient(VLMClient):
         logger.debug(f"Claude response: {response_text}")
 
         # Parse JSON from response
-        return self._parse_json_response(response_text)
+        return _parse_json_response(response_text)
 
-    def _parse_json_response(self, response_text: str) -> dict:
-        """Parse JSON from model response.
+    def generate_text(self, prompt: str, max_tokens: int = 1024) -> str:
+        """Generate a text-only completion with Claude.
 
         Args:
-            response_text: Raw text response from the model.
+            prompt: The prompt text.
+            max_tokens: Maximum number of tokens to generate.
 
         Returns:
-            Parsed JSON dictionary.
-
-        Raises:
-            ValueError: If response cannot be parsed as JSON.
+            Text response from Claude.
         """
-        # Try to extract JSON from markdown code blocks if present
-        text = response_text.strip()
-
-        if text.startswith("```json"):
-            # Remove markdown code block
-            text = text[7:]  # Remove ```json
-            if text.endswith("```"):
-                text = text[:-3]  # Remove ```
-            text = text.strip()
-        elif text.startswith("```"):
-            # Generic code block
-            text = text[3:]
-            if text.endswith("```"):
-                text = text[:-3]
-            text = text.strip()
-
-        try:
-            result = json.loads(text)
-            return result
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse JSON response: {text}")
-            raise ValueError(f"Invalid JSON response: {e}") from e
+        response = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        )
+        return response.content[0].text
 
 
 class OpenAIClient(VLMClient):
@@ -144,6 +219,7 @@ class OpenAIClient(VLMClient):
         """
         self.client = OpenAI(api_key=api_key)
         self.model = model
+        self._b64_cache = _Base64Cache()
 
     def analyze_document(self, prompt: str, images: list[bytes], max_tokens: int = 1024) -> dict:
         """Analyze document images with GPT-4 Vision.
@@ -161,11 +237,10 @@ class OpenAIClient(VLMClient):
         content = []
 
         for img_bytes in images:
-            img_b64 = base64.standard_b64encode(img_bytes).decode("utf-8")
             content.append({
                 "type": "image_url",
                 "image_url": {
-                    "url": f"data:image/png;base64,{img_b64}",
+                    "url": f"data:image/png;base64,{self._b64_cache.encode(img_bytes)}",
                 },
             })
 
@@ -184,15 +259,9 @@ class OpenAIClient(VLMClient):
                     "content": content,
                 }
             ],
+            **self._max_tokens_param(max_tokens),
         }
 
-        # Newer models (like o1 series or newer GPT versions) use max_completion_tokens
-        # instead of max_tokens.
-        if self.model.startswith(("o1-", "gpt-5")):
-            params["max_completion_tokens"] = max_tokens
-        else:
-            params["max_tokens"] = max_tokens
-
         # Make API call
         response = self.client.chat.completions.create(**params)
 
@@ -201,12 +270,40 @@ class OpenAIClient(VLMClient):
         logger.debug(f"OpenAI response: {response_text}")
 
         # Parse JSON
-        return self._parse_json_response(response_text)
+        return _parse_json_response(response_text)
 
-    def _parse_json_response(self, response_text: str) -> dict:
-        """Parse JSON from model response."""
-        # Reuse Claude's JSON parsing logic
-        return ClaudeClient._parse_json_response(None, response_text)
+    def generate_text(self, prompt: str, max_tokens: int = 1024) -> str:
+        """Generate a text-only completion with OpenAI.
+
+        Args:
+            prompt: The prompt text.
+            max_tokens: Maximum number of tokens to generate.
+
+        Returns:
+            Text response from OpenAI.
+        """
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[{"role": "user", "content": prompt}],
+            **self._max_tokens_param(max_tokens),
+        )
+        return response.choices[0].message.content
+
+    def _max_tokens_param(self, max_tokens: int) -> dict:
+        """Get the token limit parameter for the configured model.
+
+        Newer models (like o1 series or newer GPT versions) use
+        max_completion_tokens instead of max_tokens.
+
+        Args:
+            max_tokens: Maximum number of tokens to generate.
+
+        Returns:
+            Keyword argument dict for chat.completions.create().
+        """
+        if self.model.startswith(("o1-", "gpt-5")):
+            return {"max_completion_tokens": max_tokens}
+        return {"max_tokens": max_tokens}
 
 
 class GeminiClient(VLMClient):
@@ -258,17 +355,35 @@ class GeminiClient(VLMClient):
         logger.debug(f"Gemini response: {response_text}")
 
         # Parse JSON
-        return self._parse_json_response(response_text)
+        return _parse_json_response(response_text)
+
+    def generate_text(self, prompt: str, max_tokens: int = 1024) -> str:
+        """Generate a text-only completion with Gemini.
+
+        Args:
+            prompt: The prompt text.
+            max_tokens: Maximum number of tokens to generate.
 
-    def _parse_json_response(self, response_text: str) -> dict:
-        """Parse JSON from model response."""
-        # Reuse Claude's JSON parsing logic
-        return ClaudeClient._parse_json_response(None, response_text)
+        Returns:
+            Text response from Gemini.
+        """
+        response = self.client.models.generate_content(
+            model=self.model_name,
+            contents=prompt,
+            config=genai.types.GenerateContentConfig(
+                max_output_tokens=max_tokens,
+            ),
+        )
+        return response.text
 
 
+@cache
 def create_client(provider: str, api_key: str, model: str) -> VLMClient:
     """Factory function to create the appropriate VLM client.
 
+    Clients are memoized per (provider, api_key, model), so repeated callers share
+    one SDK client and its HTTP connection pool.
+
     Args:
         provider: Provider name ('claude', 'openai', or 'gemini').
         api_key: API key for the provider.
@@ -4,27 +4,76 @@ This script analyzes an existing folder structure to generate a context descript
 that helps the VLM understand how to organize documents consistently.
 """
 
+import atexit
+import heapq
+import io
 import logging
 import os
 import re
+import sqlite3
 import sys
-from collections import defaultdict
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from queue import SimpleQueue
 
-import anthropic
-from google import genai
-from google.genai import types
-from openai import OpenAI
 from simple_parsing import ArgumentParser, field
 from tqdm import tqdm
 
 from ..api_clients import create_client
-from ..config import load_config
+from ..config import Config, load_config
+
+# Prefer the linear-time RE2 engine for ignore patterns when installed (docfiler[speedups])
+try:
+    import re2 as _re2
+except ImportError:
+    _re2 = None
+
+# Compress the raw scan results when zstandard is installed (docfiler[speedups])
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
 
 logger = logging.getLogger(__name__)
 
+# Number of directory listings fetched concurrently during a scan
+SCAN_MAX_WORKERS = 16
+
+# Write buffer for the raw scan results file
+RESULTS_BUFFER_SIZE = 1 << 20
+
+# zstd level for the raw scan results; low levels keep up with the scan
+RESULTS_ZSTD_LEVEL = 3
+
+# Raw scan results, written as RESULTS_PATH_ZSTD instead when zstandard is installed
+RESULTS_PATH = Path(__file__).parent.parent.parent / "data" / "source_scanned_results.txt"
+RESULTS_PATH_ZSTD = RESULTS_PATH.with_name(RESULTS_PATH.name + ".zst")
+
+# Whether directories can be listed through an open fd (not on Windows)
+_SCANDIR_BY_FD = os.scandir in os.supports_fd
+
+# Directory listings from previous scans, keyed by directory mtime (opt-in, see --scan_cache)
+SCAN_CACHE_PATH = Path.home() / ".cache" / "docfiler" / "scan_cache.sqlite"
+
+# Seconds to wait for another scan holding the cache's write lock before giving up on the cache
+SCAN_CACHE_TIMEOUT_S = 1.0
+
+# Number of cache writes per transaction
+SCAN_CACHE_COMMIT_INTERVAL = 500
+
+# Cached listings not used by any scan for this many days are deleted
+SCAN_CACHE_MAX_AGE_DAYS = 30
+
+# Schema version of the cache database; older databases are cleared
+_SCAN_CACHE_VERSION = 1
+
 
 @dataclass
 class ContextGeneratorArgs:
@@ -36,6 +85,7 @@ class ContextGeneratorArgs:
         verbose: Enable verbose logging
         max_depth: Maximum depth to traverse in folder structure
         max_files_per_dir: Maximum number of example files to show per directory
+        scan_cache: Reuse directory listings from previous scans
     """
     path: str | None = field(default=None)
     """Path to the folder structure to analyze (defaults to SOURCE_DIR in config)"""
@@ -52,6 +102,10 @@ class ContextGeneratorArgs:
     max_files_per_dir: int = 100
     """Maximum number of example files to show per directory"""
 
+    scan_cache: bool = False
+    """Reuse directory listings from previous scans for unchanged directories (stored in
+    ~/.cache/docfiler/scan_cache.sqlite)"""
+
 # Prompt for generating context from folder structure
 CONTEXT_GENERATION_PROMPT = """You are analyzing a document filing system's folder structure.
 
@@ -74,86 +128,350 @@ Respond with ONLY the context description (no JSON, no preamble):
 """
 
 
+def _open_zstd_text(path: Path) -> io.TextIOWrapper:
+    """Open a zstd-compressed UTF-8 text file for writing.
+
+    Args:
+        path: Output file path.
+
+    Returns:
+        Text stream; closing it finishes the zstd frame and closes the file.
+    """
+    raw = open(path, "wb")
+    compressor = _zstd.ZstdCompressor(level=RESULTS_ZSTD_LEVEL)
+    writer = compressor.stream_writer(raw, write_size=RESULTS_BUFFER_SIZE)
+    return io.TextIOWrapper(io.BufferedWriter(writer, RESULTS_BUFFER_SIZE), encoding="utf-8")
+
+
+def _compile_ignore_patterns(patterns: Sequence[str]):
+    """Combine ignore patterns into one regex so each directory needs a single search.
+
+    RE2 is used when installed; patterns it cannot handle (e.g. lookarounds or
+    backreferences) fall back to the standard re module.
+
+    Args:
+        patterns: Regex patterns to ignore.
+
+    Returns:
+        Compiled pattern, or None if there are no patterns.
+    """
+    if not patterns:
+        return None
+
+    combined = "|".join(f"(?:{p})" for p in patterns)
+    if _re2 is not None:
+        try:
+            return _re2.compile(combined)
+        except _re2.error:
+            logger.debug("Ignore patterns not supported by RE2, using re instead")
+    return re.compile(combined)
+
+
+class ScanCache:
+    """SQLite store of directory listings keyed by (path, mtime_ns).
+
+    A directory's mtime changes whenever entries are added, removed or renamed,
+    so a listing stored under the current mtime can be reused without reading
+    the directory again. Safe to share between scan threads.
+
+    The cache is best-effort: if the database fails (e.g. it is locked by a
+    concurrent scan), the error is logged and the cache switches itself off,
+    so the scan continues by listing directories directly.
+    """
+
+    def __init__(self, db_path: Path):
+        """Open (or create) the cache database.
+
+        Args:
+            db_path: Path to the SQLite database file.
+
+        Raises:
+            OSError: If the cache directory cannot be created.
+            sqlite3.Error: If the database cannot be opened.
+        """
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            db_path, timeout=SCAN_CACHE_TIMEOUT_S, check_same_thread=False
+        )
+        try:
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] != _SCAN_CACHE_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS listings")
+                self._conn.execute(f"PRAGMA user_version = {_SCAN_CACHE_VERSION}")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS listings (abs_path TEXT PRIMARY KEY, "
+                "mtime_ns INTEGER, files BLOB, subdirs BLOB, seen_at INTEGER)"
+            )
+            self._conn.commit()
+        except sqlite3.Error:
+            self._conn.close()
+            raise
+        self._lock = threading.Lock()
+        self._seen_at = int(time.time())
+        self._pending_writes = 0
+
+    def get(self, dir_path: str, mtime_ns: int) -> tuple[list[str], list[str]] | None:
+        """Look up a listing stored for the directory's current mtime.
+
+        Args:
+            dir_path: Absolute directory path.
+            mtime_ns: Current modification time of the directory.
+
+        Returns:
+            Tuple of (file names, subdirectory names), or None on a miss.
+        """
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT files, subdirs FROM listings WHERE abs_path = ? AND mtime_ns = ?",
+                    (dir_path, mtime_ns),
+                ).fetchone()
+                if row is not None:
+                    # Keep listings that are still in use from being pruned
+                    self._write(
+                        "UPDATE listings SET seen_at = ? WHERE abs_path = ?",
+                        (self._seen_at, dir_path),
+                    )
+            except sqlite3.Error as e:
+                self._disable(e)
+                return None
+
+        if row is None:
+            return None
+        return _unpack_names(row[0]), _unpack_names(row[1])
+
+    def put(self, dir_path: str, mtime_ns: int, files: list[str], subdirs: list[str]):
+        """Store a directory listing, replacing any older one.
+
+        Args:
+            dir_path: Absolute directory path.
+            mtime_ns: Modification time of the directory when it was listed.
+            files: Names of non-directory entries.
+            subdirs: Names of subdirectories.
+        """
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._write(
+                    "INSERT OR REPLACE INTO listings VALUES (?, ?, ?, ?, ?)",
+                    (dir_path, mtime_ns, _pack_names(files), _pack_names(subdirs), self._seen_at),
+                )
+            except sqlite3.Error as e:
+                self._disable(e)
+
+    def close(self):
+        """Prune listings not seen for SCAN_CACHE_MAX_AGE_DAYS, commit and close the database."""
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                # Rows of deleted or renamed directories are never looked up again
+                cutoff = self._seen_at - SCAN_CACHE_MAX_AGE_DAYS * 24 * 60 * 60
+                self._conn.execute("DELETE FROM listings WHERE seen_at < ?", (cutoff,))
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to save scan cache: {e}")
+            self._conn.close()
+            self._conn = None
+
+    def _write(self, sql: str, params: tuple):
+        """Run a write, committing every SCAN_CACHE_COMMIT_INTERVAL writes.
+
+        Committing in batches keeps the write lock short, so that concurrent
+        scans sharing the database only wait briefly for each other.
+        Must be called with the lock held.
+
+        Raises:
+            sqlite3.Error: If the write or commit fails.
+        """
+        self._conn.execute(sql, params)
+        self._pending_writes += 1
+        if self._pending_writes >= SCAN_CACHE_COMMIT_INTERVAL:
+            self._conn.commit()
+            self._pending_writes = 0
+
+    def _disable(self, error: sqlite3.Error):
+        """Switch the cache off after a database error. Must be called with the lock held."""
+        logger.warning(f"Scan cache failed, listing every directory from now on: {error}")
+        try:
+            self._conn.close()
+        except sqlite3.Error:
+            pass
+        self._conn = None
+
+
+def _pack_names(names: list[str]) -> bytes:
+    """Pack file names into one NUL-separated blob."""
+    return b"\0".join(os.fsencode(name) for name in names)
+
+
+def _unpack_names(blob: bytes) -> list[str]:
+    """Unpack file names packed by _pack_names()."""
+    return [os.fsdecode(name) for name in blob.split(b"\0")] if blob else []
+
+
+def _list_dir(dir_path: str, cache: ScanCache | None) -> tuple[list[str], list[str]]:
+    """List a directory, split into files and subdirectories.
+
+    Like os.walk, symlinked directories are never followed, and are not counted
+    as files either.
+
+    Args:
+        dir_path: Directory to list.
+        cache: Optional cache of listings from previous scans.
+
+    Returns:
+        Tuple of (file names, subdirectory names) in directory order.
+
+    Raises:
+        OSError: If the directory cannot be read.
+    """
+    # Resolve the path once; the stat and the listing then both go through the fd
+    fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY) if _SCANDIR_BY_FD else None
+    target = dir_path if fd is None else fd
+    try:
+        if cache is not None:
+            mtime_ns = os.stat(target).st_mtime_ns
+            cached = cache.get(dir_path, mtime_ns)
+            if cached is not None:
+                return cached
+
+        files = []
+        subdirs = []
+        with os.scandir(target) as it:
+            for entry in it:
+                # d_type answers this without a stat() call for everything but symlinks
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif not (entry.is_symlink() and entry.is_dir()):
+                    files.append(entry.name)
+    finally:
+        if fd is not None:
+            os.close(fd)
+
+    if cache is not None:
+        cache.put(dir_path, mtime_ns, files, subdirs)
+    return files, subdirs
+
+
 def enumerate_folder_structure(
     root_path: Path,
     max_depth: int = 4,
-    ignore_patterns: list[str] | None = None
-) -> dict:
+    ignore_patterns: Sequence[str] | None = None,
+    max_files_per_dir: int | None = None,
+    cache_path: Path | None = None,
+) -> tuple[dict[str, list[str]], dict[str, int]]:
     """Enumerate the folder structure and collect information.
 
+    Directories are visited breadth-first with os.scandir() in a single pass,
+    never deeper than max_depth. Listings are prefetched by a thread pool so
+    that slow (e.g. network) filesystems have several readdirs in flight.
+    Only the first max_files_per_dir file names of each directory are kept;
+    the full count is tracked separately. With cache_path, listings of
+    directories unchanged since a previous scan are reused.
+
     Args:
         root_path: Root directory to analyze.
         max_depth: Maximum depth to traverse.
-        ignore_patterns: List of regex patterns to ignore.
+        ignore_patterns: Regex patterns to ignore.
+        max_files_per_dir: Maximum number of file names to keep per directory (None keeps all).
+        cache_path: Optional SQLite file caching directory listings between scans.
 
     Returns:
-        Dictionary with folder structure information.
+        Tuple of (folder -> example file names, folder -> total file count).
 
     Note:
         - 'Items' refers to the total count of filesystem entries (files + directories).
         - 'Files scanned' specifically refers to regular files encountered during the scan.
     """
-    structure = defaultdict(list)
+    structure = {}
+    file_counts = {}
 
     logger.info(f"Scanning directory tree: {root_path}")
 
-    # Compile regex patterns
-    regexes = [re.compile(p) for p in (ignore_patterns or [])]
-
-    # Preliminary rough scan to count directories to be visited for the progress bar
-    logger.info("Performing rough directory scan...")
-    total_dirs_to_visit = 0
-    for root, dirs, _files in os.walk(root_path):
-        current_rel = Path(root).relative_to(root_path)
-        depth = len(current_rel.parts)
-
-        # Check if current directory matches any ignore pattern
-        if any(r.search(str(current_rel)) for r in regexes):
-            dirs[:] = []  # Skip this directory and its children
-            continue
+    ignore_re = _compile_ignore_patterns(ignore_patterns or ())
 
-        if depth <= max_depth:
-            total_dirs_to_visit += 1
-            if depth == max_depth:
-                dirs[:] = [] # Don't count subdirs if we won't visit them
-
-    # Collect raw paths for secondary output
-    raw_results = []
+    # Stream raw paths to a secondary output file as they are found
+    if _zstd is not None:
+        results_path, stale_results_path = RESULTS_PATH_ZSTD, RESULTS_PATH
+    else:
+        results_path, stale_results_path = RESULTS_PATH, RESULTS_PATH_ZSTD
+    try:
+        results_path.parent.mkdir(parents=True, exist_ok=True)
+        if _zstd is not None:
+            results_file = _open_zstd_text(results_path)
+        else:
+            results_file = open(results_path, "w", encoding="utf-8", buffering=RESULTS_BUFFER_SIZE)
+    except OSError as e:
+        logger.warning(f"Failed to save raw results: {e}")
+        results_path = None
+        results_file = open(os.devnull, "w", encoding="utf-8")
+    results_file.write(f"# Raw Scan Results (Max Depth: {max_depth})\n")
+    results_file.write(f"# Root: {root_path}\n")
+    results_file.write(f"# Timestamp: {datetime.now().isoformat()}\n")
+    results_file.write("-" * 50 + "\n")
 
     # Single pass: enumerate and process with progress updates
     file_count = 0
     dir_count = 0
 
-    # Use tqdm with total=total_dirs_to_visit to show percentage
-    with tqdm(total=total_dirs_to_visit, desc="Analyzing structure", unit="dirs", mininterval=0.5) as pbar:
+    cache = None
+    if cache_path is not None:
         try:
-            # We use os.walk for controlled depth and efficient scanning
-            for root, dirs, files in os.walk(root_path):
-                current_path = Path(root)
-                relative_dir = current_path.relative_to(root_path)
-                depth = len(relative_dir.parts)
-
-                # Check if current directory matches any ignore pattern
-                if any(r.search(str(relative_dir)) for r in regexes):
-                    dirs[:] = [] # Skip this directory and its children
+            cache = ScanCache(cache_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Scan cache unavailable, listing every directory: {e}")
+
+    # Directory listings are fetched by a thread pool as soon as a directory is
+    # discovered, but consumed in breadth-first order from this queue of
+    # (pending listing, absolute path, path relative to root, depth)
+    executor = ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS)
+    queue = deque()
+
+    def enqueue(dir_path: str, relative_dir: str, depth: int):
+        queue.append((executor.submit(_list_dir, dir_path, cache), dir_path, relative_dir, depth))
+
+    # "." is the root itself; it is always scanned, so ignore patterns only apply below it
+    enqueue(str(root_path), ".", 0)
+
+    # The number of directories is unknown up front, so the progress bar only counts
+    with results_file, tqdm(desc="Analyzing structure", unit="dirs", mininterval=0.5) as pbar:
+        try:
+            while queue:
+                listing, dir_path, relative_dir, depth = queue.popleft()
+
+                try:
+                    files, subdirs = listing.result()
+                except OSError as e:
+                    logger.debug(f"Skipping unreadable directory {dir_path}: {e}")
                     continue
 
                 dir_count += 1
                 pbar.update(1)
-                raw_results.append(f"DIR: {relative_dir}")
-
-                # If at max depth, stop descending further
-                if depth == max_depth:
-                    dirs[:] = []
+                results_file.write(f"DIR: {relative_dir}\n")
 
                 # Use relative path for structure, "root" for top level
-                parent_key = str(relative_dir) if relative_dir != Path(".") else "root"
-
-                # Process files in this directory
-                for f in files:
-                    file_count += 1
-                    structure[parent_key].append(f)
-                    raw_results.append(f"FILE: {relative_dir / f}")
+                parent_key = relative_dir if relative_dir != "." else "root"
+                prefix = "" if relative_dir == "." else relative_dir + os.sep
+
+                # Subdirectories past max_depth are never queued, nor matched against patterns
+                if depth < max_depth:
+                    for name in subdirs:
+                        relative_subdir = prefix + name
+                        # Check if the directory matches any ignore pattern
+                        if ignore_re is None or not ignore_re.search(relative_subdir):
+                            enqueue(os.path.join(dir_path, name), relative_subdir, depth + 1)
+
+                # Prefix every name with the shared path prefix in a single write call
+                file_prefix = f"FILE: {prefix}"
+                results_file.writelines(f"{file_prefix}{name}\n" for name in files)
+
+                if files:
+                    structure[parent_key] = files[:max_files_per_dir]
+                    file_counts[parent_key] = len(files)
+                file_count += len(files)
 
                 # Update postfix with file count and the current directory name (truncated if long)
                 dir_label = parent_key if len(parent_key) <= 25 else f"...{parent_key[-22:]}"
@@ -161,62 +479,89 @@ def enumerate_folder_structure(
         except KeyboardInterrupt:
             logger.info("\nScan interrupted by user. Proceeding with currently collected data...")
             logger.info("Press Ctrl+C again to exit immediately.")
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+            if cache is not None:
+                cache.close()
 
-    # Save raw results to file
-    results_path = Path(__file__).parent.parent.parent / "data" / "source_scanned_results.txt"
-    try:
-        results_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(results_path, "w", encoding="utf-8") as f:
-            f.write(f"# Raw Scan Results (Max Depth: {max_depth})\n")
-            f.write(f"# Root: {root_path}\n")
-            f.write(f"# Timestamp: {datetime.now().isoformat()}\n")
-            f.write("-" * 50 + "\n")
-            f.write("\n".join(raw_results))
+    if results_path:
         logger.info(f"Raw scan results saved to {results_path}")
-    except Exception as e:
-        logger.warning(f"Failed to save raw results: {e}")
+        # Results of an earlier scan in the other format would otherwise be read as current
+        try:
+            stale_results_path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(f"Failed to remove stale raw results {stale_results_path}: {e}")
 
     logger.info(f"Found {file_count} files in {dir_count} directories")
     logger.info(f"Collected {len(structure)} folders within max depth {max_depth}")
 
-    return dict(structure)
+    return structure, file_counts
 
 
-def format_folder_info(structure: dict, max_files_per_dir: int = 500, max_folders: int = 2000) -> str:
+def format_folder_info(
+    structure: dict,
+    max_files_per_dir: int = 500,
+    max_folders: int = 2000,
+    file_counts: dict[str, int] | None = None,
+) -> str:
     """Format folder structure information for the prompt.
 
     Args:
         structure: Dictionary of folder -> files.
         max_files_per_dir: Maximum number of example files to show per directory.
-        max_folders: Maximum number of folders to include to avoid hitting token limits.
+        max_folders: Maximum number of folders to include to avoid hitting token limits;
+            beyond it, the folders with the most files are kept.
+        file_counts: Optional folder -> total file count, for structures whose file
+            lists were truncated during the scan.
 
     Returns:
         Formatted string describing the structure.
     """
-    lines = []
-    lines.append("Folder Structure:")
-    lines.append("=" * 50)
+    lines = _iter_folder_info_lines(structure, max_files_per_dir, max_folders, file_counts or {})
+    return "\n".join(lines)
+
 
-    all_folders = sorted(structure.items())
+def _iter_folder_info_lines(
+    structure: dict,
+    max_files_per_dir: int,
+    max_folders: int,
+    file_counts: dict[str, int],
+) -> Iterator[str]:
+    """Yield the lines of format_folder_info() one at a time.
 
-    if len(all_folders) > max_folders:
-        logger.warning(f"Too many folders ({len(all_folders)}). Limiting to {max_folders} for context generation.")
-        all_folders = all_folders[:max_folders]
-        lines.append(f"(Showing first {max_folders} folders out of {len(structure)})")
+    Only the folder names (or the largest max_folders of them) are sorted; file
+    lists are read from the structure as each folder is emitted.
+    """
+    yield "Folder Structure:"
+    yield "=" * 50
 
-    for folder, files in all_folders:
-        lines.append(f"\n{folder}/")
-        lines.append(f"  ({len(files)} files)")
+    if len(structure) > max_folders:
+        logger.warning(
+            f"Too many folders ({len(structure)}). "
+            f"Limiting to the {max_folders} largest for context generation."
+        )
+        # Keep the folders with the most files rather than an alphabetical prefix
+        largest = heapq.nlargest(
+            max_folders, structure, key=lambda folder: file_counts.get(folder, len(structure[folder]))
+        )
+        folders = sorted(largest)
+        yield f"(Showing the {max_folders} largest folders out of {len(structure)})"
+    else:
+        folders = sorted(structure)
+
+    for folder in folders:
+        files = structure[folder]
+        total = file_counts.get(folder, len(files))
+        yield f"\n{folder}/"
+        yield f"  ({total} files)"
 
         # Show a few example files
         examples = files[:max_files_per_dir]
         for file in examples:
-            lines.append(f"  - {file}")
-
-        if len(files) > max_files_per_dir:
-            lines.append(f"  ... and {len(files) - max_files_per_dir} more")
+            yield f"  - {file}"
 
-    return "\n".join(lines)
+        if total > len(examples):
+            yield f"  ... and {total - len(examples)} more"
 
 
 def generate_context(
@@ -224,6 +569,8 @@ def generate_context(
     output_path: str | Path | None = None,
     max_depth: int = 4,
     max_files_per_dir: int = 5,
+    scan_cache: bool = False,
+    config: Config | None = None,
 ) -> str:
     """Generate context by analyzing a folder structure.
 
@@ -232,26 +579,32 @@ def generate_context(
         output_path: Optional path to save the context. If None, prints to stdout.
         max_depth: Maximum depth to traverse in folder structure.
         max_files_per_dir: Maximum number of example files to show per directory.
+        scan_cache: Reuse directory listings cached by previous scans.
+        config: Configuration to use; loaded from the environment if None.
 
     Returns:
         Generated context string.
     """
     root_path = Path(root_path)
 
-    if not root_path.exists() or not root_path.is_dir():
+    # is_dir() is also False for missing paths, so one stat covers both checks
+    if not root_path.is_dir():
         msg = f"Directory does not exist: {root_path}"
         raise ValueError(msg)
 
     logger.info(f"Analyzing folder structure: {root_path}")
 
     # Load config early to get ignore patterns and other settings
-    config = load_config()
+    if config is None:
+        config = load_config()
 
     # Enumerate folder structure
-    structure = enumerate_folder_structure(
+    structure, file_counts = enumerate_folder_structure(
         root_path,
         max_depth=max_depth,
-        ignore_patterns=config.scan_ignore_patterns
+        ignore_patterns=config.scan_ignore_patterns,
+        max_files_per_dir=max_files_per_dir,
+        cache_path=SCAN_CACHE_PATH if scan_cache else None,
     )
 
     if not structure:
@@ -259,11 +612,15 @@ def generate_context(
         return "Empty folder structure - no context available."
 
     # Format for prompt
-    folder_info = format_folder_info(structure, max_files_per_dir=max_files_per_dir)
+    folder_info = format_folder_info(
+        structure,
+        max_files_per_dir=max_files_per_dir,
+        file_counts=file_counts,
+    )
     logger.debug(f"Folder info:\n{folder_info}")
 
     # Create API client
-    create_client(
+    client = create_client(
         provider=config.vlm_provider,
         api_key=config.active_api_key,
         model=config.active_model,
@@ -274,13 +631,8 @@ def generate_context(
 
     logger.info("Sending request to LLM to generate context")
 
-    # For context generation, we don't need images, but our API expects them
-    # So we pass an empty list (each client should handle this gracefully)
-    # Actually, let me modify this to use a text-only API call
-
-    # Since our VLMClient interface requires images, we'll need a different approach
-    # Let's use the provider's native client for text-only requests
-    context = _generate_with_provider(config, prompt)
+    # Context generation might need more space than a filing suggestion
+    context = client.generate_text(prompt, max_tokens=config.vlm_max_tokens * 2)
 
     logger.info("Context generated successfully")
 
@@ -302,61 +654,6 @@ def generate_context(
     return context
 
 
-def _generate_with_provider(config, prompt: str) -> str:
-    """Generate context using the configured provider.
-
-    Args:
-        config: Application configuration.
-        prompt: The prompt to send.
-
-    Returns:
-        Generated context string.
-    """
-    provider = config.vlm_provider
-
-    if provider == "claude":
-        client = anthropic.Anthropic(api_key=config.active_api_key)
-        response = client.messages.create(
-            model=config.active_model,
-            max_tokens=config.vlm_max_tokens * 2,  # Context generation might need more space
-            messages=[{"role": "user", "content": prompt}],
-        )
-        return response.content[0].text
-
-    elif provider == "openai":
-        client = OpenAI(api_key=config.active_api_key)
-
-        # Determine token parameter based on model
-        max_tokens = config.vlm_max_tokens * 2
-        params = {
-            "model": config.active_model,
-            "messages": [{"role": "user", "content": prompt}],
-        }
-
-        if config.active_model.startswith(("o1-", "gpt-5")):
-            params["max_completion_tokens"] = max_tokens
-        else:
-            params["max_tokens"] = max_tokens
-
-        response = client.chat.completions.create(**params)
-        return response.choices[0].message.content
-
-    elif provider == "gemini":
-        client = genai.Client(api_key=config.active_api_key)
-        response = client.models.generate_content(
-            model=config.active_model,
-            contents=prompt,
-            config=types.GenerateContentConfig(
-                max_output_tokens=config.vlm_max_tokens * 2,
-            ),
-        )
-        return response.text
-
-    else:
-        msg = f"Unsupported provider: {provider}"
-        raise ValueError(msg)
-
-
 def main():
     """Main entry point for the context generator CLI."""
     parser = ArgumentParser(description="Generate filing context from an existing folder structure")
@@ -371,21 +668,29 @@ def main():
 
     log_level = logging.DEBUG if args.verbose else logging.INFO
 
-    # Create root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
+    # One formatter shared by both handlers
+    formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setLevel(log_level)
-    console_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-    root_logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
 
     # File handler
     file_handler = logging.FileHandler(log_filename)
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
-    root_logger.addHandler(file_handler)
+    file_handler.setFormatter(formatter)
+
+    # Format and write records on a background thread, off the scan loop
+    log_queue = SimpleQueue()
+    listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)  # Flushes queued records, including on sys.exit()
+
+    # Create root logger
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(QueueHandler(log_queue))
 
     logger.info(f"Logging to file: {log_filename}")
 
@@ -413,6 +718,8 @@ def main():
             args.output,
             max_depth=args.max_depth,
             max_files_per_dir=args.max_files_per_dir,
+            scan_cache=args.scan_cache,
+            config=config,
         )
     except Exception as e:
         logger.error(f"Error generating context: {e}", exc_info=True)
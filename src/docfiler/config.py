@@ -4,7 +4,8 @@ This module handles loading and validating configuration from environment variab
 """
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
 from typing import Literal
 
@@ -12,10 +13,30 @@ from dotenv import load_dotenv
 
 VLMProvider = Literal["claude", "openai", "gemini"]
 
+# Config fields holding each provider's (API key, model)
+_PROVIDER_FIELDS = {
+    "claude": ("anthropic_api_key", "claude_model"),
+    "openai": ("openai_api_key", "openai_model"),
+    "gemini": ("gemini_api_key", "gemini_model"),
+}
+_VALID_PROVIDERS = frozenset(_PROVIDER_FIELDS)
 
-@dataclass
+# Accepted LOG_LEVEL values, in the order shown in error messages
+_LOG_LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
+_VALID_LOG_LEVELS = frozenset(_LOG_LEVELS)
+
+# Positive integer settings as (Config field, environment variable, default)
+_POSITIVE_INT_SETTINGS = (
+    ("vlm_max_tokens", "VLM_MAX_TOKENS", "1024"),
+    ("image_dpi", "IMAGE_DPI", "300"),
+    ("max_image_dimension", "MAX_IMAGE_DIMENSION", "2048"),
+    ("pdf_pages_to_extract", "PDF_PAGES_TO_EXTRACT", "3"),
+)
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
-    """Application configuration."""
+    """Application configuration (immutable; shared by every load_config() caller)."""
 
     # API Configuration
     vlm_provider: VLMProvider
@@ -37,39 +58,75 @@ class Config:
     # File Organization
     source_dir: str | None
     default_dest_base: str | None
-    scan_ignore_patterns: list[str]
+    scan_ignore_patterns: tuple[str, ...]
 
     # Logging
     log_level: str
 
+    # Resolved from vlm_provider once, in __post_init__
+    _active_api_key: str | None = field(init=False, repr=False, compare=False)
+    _active_model: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        """Validate the provider and resolve its API key and model.
+
+        Raises:
+            ValueError: If vlm_provider is not a supported provider.
+        """
+        if self.vlm_provider not in _VALID_PROVIDERS:
+            msg = f"Unknown VLM provider: {self.vlm_provider}"
+            raise ValueError(msg)
+        key_field, model_field = _PROVIDER_FIELDS[self.vlm_provider]
+        # Frozen dataclass: assign through object
+        object.__setattr__(self, "_active_api_key", getattr(self, key_field))
+        object.__setattr__(self, "_active_model", getattr(self, model_field))
+
     @property
     def active_api_key(self) -> str:
         """Get the API key for the active provider."""
-        key_map = {
-            "claude": self.anthropic_api_key,
-            "openai": self.openai_api_key,
-            "gemini": self.gemini_api_key,
-        }
-        key = key_map.get(self.vlm_provider)
-        if not key:
+        if not self._active_api_key:
             msg = f"API key not configured for provider: {self.vlm_provider}"
             raise ValueError(msg)
-        return key
+        return self._active_api_key
 
     @property
     def active_model(self) -> str:
         """Get the model name for the active provider."""
-        model_map = {
-            "claude": self.claude_model,
-            "openai": self.openai_model,
-            "gemini": self.gemini_model,
-        }
-        return model_map[self.vlm_provider]
+        return self._active_model
+
+
+def _parse_positive_int(env: dict[str, str], env_name: str, default: str) -> int:
+    """Read a positive integer from an environment variable.
+
+    Args:
+        env: Snapshot of the environment.
+        env_name: Environment variable name.
+        default: Value to use when the variable is unset.
+
+    Returns:
+        Parsed integer.
+
+    Raises:
+        ValueError: If the value is not a positive integer.
+    """
+    try:
+        value = int(env.get(env_name, default))
+        if value <= 0:
+            raise ValueError(f"{env_name} must be positive")
+    except ValueError as e:
+        msg = f"Invalid {env_name}: {e}"
+        raise ValueError(msg) from e
+    return value
 
 
+@cache
 def load_config(env_path: str | Path | None = None) -> Config:
     """Load configuration from environment variables.
 
+    Configuration is read once per process: the result is memoized per env_path,
+    so the environment and .env file are only read on the first call, and later
+    edits to either are not seen. Call clear_config_cache() to reload.
+
     Args:
         env_path: Path to .env file. If None, searches for .env in current directory.
 
@@ -85,68 +142,43 @@ def load_config(env_path: str | Path | None = None) -> Config:
     else:
         load_dotenv()
 
+    # Read everything from one snapshot of the environment
+    env = dict(os.environ)
+
     # Load and validate VLM provider
-    vlm_provider = os.getenv("VLM_PROVIDER", "claude").lower()
-    if vlm_provider not in ("claude", "openai", "gemini"):
+    vlm_provider = env.get("VLM_PROVIDER", "claude").lower()
+    if vlm_provider not in _VALID_PROVIDERS:
         msg = f"Invalid VLM_PROVIDER: {vlm_provider}. Must be 'claude', 'openai', or 'gemini'"
         raise ValueError(msg)
 
     # Load API keys
-    anthropic_api_key = os.getenv("ANTHROPIC_API_KEY")
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    gemini_api_key = os.getenv("GEMINI_API_KEY")
+    anthropic_api_key = env.get("ANTHROPIC_API_KEY")
+    openai_api_key = env.get("OPENAI_API_KEY")
+    gemini_api_key = env.get("GEMINI_API_KEY")
 
     # Load model configurations
-    claude_model = os.getenv("CLAUDE_MODEL", "claude-3-5-sonnet-20241022")
-    openai_model = os.getenv("OPENAI_MODEL", "gpt-4o")
-    gemini_model = os.getenv("GEMINI_MODEL", "gemini-2.0-flash-exp")
-
-    try:
-        vlm_max_tokens = int(os.getenv("VLM_MAX_TOKENS", "1024"))
-        if vlm_max_tokens <= 0:
-            raise ValueError("VLM_MAX_TOKENS must be positive")
-    except ValueError as e:
-        msg = f"Invalid VLM_MAX_TOKENS: {e}"
-        raise ValueError(msg) from e
+    claude_model = env.get("CLAUDE_MODEL", "claude-3-5-sonnet-20241022")
+    openai_model = env.get("OPENAI_MODEL", "gpt-4o")
+    gemini_model = env.get("GEMINI_MODEL", "gemini-2.0-flash-exp")
 
-    # Load image processing settings
-    try:
-        image_dpi = int(os.getenv("IMAGE_DPI", "300"))
-        if image_dpi <= 0:
-            raise ValueError("IMAGE_DPI must be positive")
-    except ValueError as e:
-        msg = f"Invalid IMAGE_DPI: {e}"
-        raise ValueError(msg) from e
-
-    try:
-        max_image_dimension = int(os.getenv("MAX_IMAGE_DIMENSION", "2048"))
-        if max_image_dimension <= 0:
-            raise ValueError("MAX_IMAGE_DIMENSION must be positive")
-    except ValueError as e:
-        msg = f"Invalid MAX_IMAGE_DIMENSION: {e}"
-        raise ValueError(msg) from e
-
-    try:
-        pdf_pages_to_extract = int(os.getenv("PDF_PAGES_TO_EXTRACT", "3"))
-        if pdf_pages_to_extract <= 0:
-            raise ValueError("PDF_PAGES_TO_EXTRACT must be positive")
-    except ValueError as e:
-        msg = f"Invalid PDF_PAGES_TO_EXTRACT: {e}"
-        raise ValueError(msg) from e
+    # Load token and image processing limits
+    int_settings = {
+        field_name: _parse_positive_int(env, env_name, default)
+        for field_name, env_name, default in _POSITIVE_INT_SETTINGS
+    }
 
     # Load file organization settings
-    source_dir = os.getenv("SOURCE_DIR") or None
-    default_dest_base = os.getenv("DEFAULT_DEST_BASE") or None
+    source_dir = env.get("SOURCE_DIR") or None
+    default_dest_base = env.get("DEFAULT_DEST_BASE") or None
 
     # Load scan ignore patterns (comma-separated regex)
-    ignore_raw = os.getenv("SCAN_IGNORE_PATTERNS", "")
-    scan_ignore_patterns = [p.strip() for p in ignore_raw.split(",") if p.strip()]
+    ignore_raw = env.get("SCAN_IGNORE_PATTERNS", "")
+    scan_ignore_patterns = tuple(p.strip() for p in ignore_raw.split(",") if p.strip())
 
     # Load logging configuration
-    log_level = os.getenv("LOG_LEVEL", "INFO").upper()
-    valid_log_levels = ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL")
-    if log_level not in valid_log_levels:
-        msg = f"Invalid LOG_LEVEL: {log_level}. Must be one of {valid_log_levels}"
+    log_level = env.get("LOG_LEVEL", "INFO").upper()
+    if log_level not in _VALID_LOG_LEVELS:
+        msg = f"Invalid LOG_LEVEL: {log_level}. Must be one of {_LOG_LEVELS}"
         raise ValueError(msg)
 
     config = Config(
@@ -154,20 +186,22 @@ def load_config(env_path: str | Path | None = None) -> Config:
         anthropic_api_key=anthropic_api_key,
         openai_api_key=openai_api_key,
         gemini_api_key=gemini_api_key,
-        vlm_max_tokens=vlm_max_tokens,
         claude_model=claude_model,
         openai_model=openai_model,
         gemini_model=gemini_model,
-        image_dpi=image_dpi,
-        max_image_dimension=max_image_dimension,
-        pdf_pages_to_extract=pdf_pages_to_extract,
         source_dir=source_dir,
         default_dest_base=default_dest_base,
         scan_ignore_patterns=scan_ignore_patterns,
         log_level=log_level,
+        **int_settings,
     )
 
     # Validate that the selected provider has an API key
     _ = config.active_api_key  # This will raise if key is missing
 
     return config
+
+
+def clear_config_cache():
+    """Forget memoized configs so the next load_config() re-reads the environment."""
+    load_config.cache_clear()
@@ -5,13 +5,25 @@ This module provides a widget to display and edit document filing information.
 
 import io
 import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 
 from pdf2image import convert_from_path
 from PIL import Image
 from pypdf import PdfReader
-from PyQt6.QtCore import Qt, pyqtSignal
-from PyQt6.QtGui import QPixmap
+from PyQt6.QtCore import (
+    QObject,
+    QRunnable,
+    QSignalBlocker,
+    QSize,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QImage, QPixmap
 from PyQt6.QtWidgets import (
     QFileDialog,
     QHBoxLayout,
@@ -24,11 +36,456 @@ from PyQt6.QtWidgets import (
     QWidget,
 )
 
+# Render PDF pages in-process with PyMuPDF when installed (docfiler[pdf-preview])
+try:
+    import pymupdf as _pymupdf
+except ImportError:
+    _pymupdf = None
+
+# PyMuPDF is not thread-safe; preview loaders render one document at a time through it
+_PYMUPDF_LOCK = threading.Lock()
+
 # Support high-resolution scans by increasing the decompression bomb limit (approx 200MP)
 Image.MAX_IMAGE_PIXELS = 200_000_000
 
 logger = logging.getLogger(__name__)
 
+# Longest side in pixels of decoded image previews
+PREVIEW_MAX_DIMENSION = 2000
+
+# Downscale ratio from which previews are resampled by area averaging instead of bilinear
+PREVIEW_AREA_RESAMPLE_RATIO = 2
+
+# Number of previews decoded ahead of time concurrently, limiting disk and CPU contention
+PREFETCH_MAX_LOADS = 2
+
+# Number of preview decodes running at once: the selected file plus the prefetches
+PREVIEW_MAX_LOADS = PREFETCH_MAX_LOADS + 1
+
+# Width in pixels of rendered PDF page previews
+PDF_PREVIEW_WIDTH = 1200
+
+# Number of decoded previews kept for files the user switches back to
+PREVIEW_CACHE_SIZE = 16
+
+# Memory budget of the preview cache; least recently shown previews are evicted first
+PREVIEW_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Delay before a fast-scaled preview is redrawn with smooth scaling (about one frame)
+SMOOTH_PREVIEW_DELAY_MS = 16
+
+# Same delay while zooming or resizing, long enough to span consecutive wheel ticks/resize events
+INTERACTIVE_SMOOTH_DELAY_MS = 120
+
+# Delay after the last keystroke before an edited filename/destination is emitted
+EDIT_DEBOUNCE_MS = 150
+
+IMAGE_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif"})
+PREVIEW_SUFFIXES = IMAGE_SUFFIXES | {".pdf"}
+
+
+# PIL modes QImage can wrap without conversion, as (QImage format, bytes per pixel)
+_QIMAGE_FORMATS = {
+    "L": (QImage.Format.Format_Grayscale8, 1),
+    "RGB": (QImage.Format.Format_RGB888, 3),
+    "RGBA": (QImage.Format.Format_RGBA8888, 4),
+}
+
+# PIL modes with more than 8 bits per channel, which PNG preserves for Qt
+_HIGH_DEPTH_MODES = frozenset({"I", "I;16", "I;16B", "I;16L", "F"})
+
+
+class PreviewError(Exception):
+    """A preview could not be produced; the message is shown in its place."""
+
+
+def _pil_to_qimage(img: Image.Image) -> QImage:
+    """Convert PIL Image to QImage.
+
+    Unlike QPixmap, QImage may be created outside the GUI thread. 8-bit images
+    are wrapped from their raw pixels; only high bit depth images, which Qt
+    would otherwise clip, go through a PNG encode/decode.
+
+    Args:
+        img: PIL Image object.
+
+    Returns:
+        QImage object.
+    """
+    if img.mode in _HIGH_DEPTH_MODES:
+        # The PNG is decoded right away, so skip compressing it; Qt reads the buffer in place
+        img_byte_arr = io.BytesIO()
+        img.save(img_byte_arr, format='PNG', compress_level=0)
+        image = QImage()
+        image.loadFromData(img_byte_arr.getbuffer())
+        return image
+
+    if img.mode not in _QIMAGE_FORMATS:
+        has_alpha = img.mode in ("LA", "La", "PA", "RGBa") or "transparency" in img.info
+        img = img.convert("RGBA" if has_alpha else "L" if img.mode == "1" else "RGB")
+
+    image_format, bytes_per_pixel = _QIMAGE_FORMATS[img.mode]
+    data = img.tobytes()
+    # copy() detaches the image from the bytes buffer it was built on
+    return QImage(data, img.width, img.height, img.width * bytes_per_pixel, image_format).copy()
+
+
+def load_preview_image(file_path: Path) -> QImage:
+    """Decode a preview of an image file or of the first page of a PDF.
+
+    Args:
+        file_path: Path to an image or PDF file.
+
+    Returns:
+        Decoded preview image.
+
+    Raises:
+        PreviewError: If no preview can be produced.
+    """
+    loader = _PREVIEW_LOADERS.get(file_path.suffix.lower(), _load_image_preview)
+    return loader(file_path)
+
+
+def _load_image_preview(file_path: Path) -> QImage:
+    """Decode an image file, downsized for preview.
+
+    Args:
+        file_path: Path to the image.
+
+    Returns:
+        Decoded preview image.
+
+    Raises:
+        PreviewError: If the image cannot be decoded.
+    """
+    try:
+        logger.debug(f"Loading image file with PIL optimization: {file_path}")
+
+        # Load and downsize using PIL before converting to QImage
+        with Image.open(str(file_path)) as img:
+            image = _pil_to_qimage(_downsize_for_preview(img))
+
+        if image.isNull():
+            raise ValueError("Failed to create QImage from image data")
+        return image
+
+    except Exception as e:
+        logger.error(f"Image preview loading failed for {file_path}: {e}", exc_info=True)
+        raise PreviewError(f"Could not load image\n{file_path.name}\n{str(e)}") from e
+
+
+def _downsize_for_preview(img: Image.Image) -> Image.Image:
+    """Shrink an opened image to at most PREVIEW_MAX_DIMENSION, decoding as little as possible.
+
+    Args:
+        img: Opened, not yet loaded, image.
+
+    Returns:
+        The image, downsized if it was larger than the preview size.
+    """
+    limit = PREVIEW_MAX_DIMENSION
+
+    # Let libjpeg decode at 1/2, 1/4 or 1/8 scale; a no-op for small JPEGs and other formats
+    img.draft(None, (limit, limit))
+
+    # If very large, downsize now (thumbnail() is memory efficient)
+    if img.width > limit or img.height > limit:
+        logger.debug(f"Downsizing large image for preview: {img.width}x{img.height}")
+        if img.mode == "1":
+            # Bilevel images only support nearest-neighbour resampling; shrink as grayscale
+            img = img.convert("L")
+        # Qt smooth-scales the preview again for display, so a cheap anti-aliased filter is
+        # enough here: area averaging for big reductions, bilinear otherwise
+        if max(img.size) >= PREVIEW_AREA_RESAMPLE_RATIO * limit:
+            resample = Image.Resampling.BOX
+        else:
+            resample = Image.Resampling.BILINEAR
+        img.thumbnail((limit, limit), resample)
+    return img
+
+
+def _load_pdf_preview(file_path: Path) -> QImage:
+    """Render the first page of a PDF, falling back to its first embedded image.
+
+    Args:
+        file_path: Path to the PDF.
+
+    Returns:
+        Decoded preview image.
+
+    Raises:
+        PreviewError: If neither approach produces an image.
+    """
+    # For PDFs, try multiple approaches
+    logger.debug(f"Loading PDF file: {file_path}")
+    try:
+        image = _render_first_pdf_page(file_path)
+        if image is not None:
+            return image
+        return _extract_first_pdf_image(file_path)
+    except PreviewError:
+        raise
+    except Exception as e:
+        logger.error(f"PDF preview failed for {file_path}: {e}")
+        raise PreviewError(f"Could not load PDF preview.\n{str(e)}") from e
+
+
+def _render_first_pdf_page(file_path: Path) -> QImage | None:
+    """Render the first page of a PDF, with PyMuPDF if installed, else pdf2image.
+
+    Args:
+        file_path: Path to the PDF.
+
+    Returns:
+        Rendered page, or None if rendering failed.
+    """
+    if _pymupdf is not None:
+        try:
+            image = _render_first_pdf_page_pymupdf(file_path)
+            if not image.isNull():
+                logger.debug(f"Successfully rendered PDF with PyMuPDF: {file_path.name}")
+                return image
+            logger.warning("PyMuPDF produced null image")
+        except Exception as e:
+            logger.warning(f"PyMuPDF failed: {e}")
+
+    try:
+        logger.debug("Attempting PDF rendering with pdf2image")
+
+        # Convert first page only (use a higher DPI for zooming headroom)
+        images = convert_from_path(
+            str(file_path),
+            first_page=1,
+            last_page=1,
+            dpi=200,
+            size=(PDF_PREVIEW_WIDTH, None)
+        )
+
+        if images:
+            # Convert PIL Image to QImage
+            image = _pil_to_qimage(images[0])
+
+            if not image.isNull():
+                logger.debug(f"Successfully rendered PDF with pdf2image: {file_path.name}")
+                return image
+            else:
+                logger.warning("pdf2image produced null image")
+        else:
+            logger.warning("pdf2image returned no images")
+
+    except Exception as e:
+        logger.warning(f"pdf2image failed: {e}")
+
+    return None
+
+
+def _render_first_pdf_page_pymupdf(file_path: Path) -> QImage:
+    """Render the first page of a PDF in-process with PyMuPDF.
+
+    Args:
+        file_path: Path to the PDF.
+
+    Returns:
+        Rendered page, PDF_PREVIEW_WIDTH pixels wide.
+    """
+    logger.debug("Attempting PDF rendering with PyMuPDF")
+    # Held until the pixels are copied out, so no PyMuPDF object is touched concurrently
+    with _PYMUPDF_LOCK:
+        with _pymupdf.open(file_path) as doc:
+            page = doc.load_page(0)
+            zoom = PDF_PREVIEW_WIDTH / page.rect.width
+            # Scanned grayscale/bilevel pages render to one byte per pixel instead of three
+            images = page.get_images()
+            grayscale = bool(images) and all(image[5] == "DeviceGray" for image in images)
+            pixmap = page.get_pixmap(
+                matrix=_pymupdf.Matrix(zoom, zoom),
+                colorspace=_pymupdf.csGRAY if grayscale else _pymupdf.csRGB,
+                alpha=False,
+            )
+
+        image_format = (
+            QImage.Format.Format_Grayscale8 if grayscale else QImage.Format.Format_RGB888
+        )
+        # Wrap the pixmap's own buffer (samples would copy it) and copy out before it is freed
+        image = QImage(
+            pixmap.samples_mv,
+            pixmap.width,
+            pixmap.height,
+            pixmap.stride,
+            image_format,
+        ).copy()
+        del pixmap
+    return image
+
+
+def _extract_first_pdf_image(file_path: Path) -> QImage:
+    """Extract the first embedded image from the first page of a PDF with pypdf.
+
+    Args:
+        file_path: Path to the PDF.
+
+    Returns:
+        Extracted image.
+
+    Raises:
+        PreviewError: If the PDF has no pages or no usable image on its first page.
+    """
+    logger.debug("Attempting PDF image extraction with pypdf")
+    pdf_reader = PdfReader(str(file_path))
+
+    if len(pdf_reader.pages) == 0:
+        raise PreviewError(f"PDF file has no pages.\n{file_path.name}")
+
+    page = pdf_reader.pages[0]
+
+    # Try to extract images from the page
+    try:
+        if '/Resources' in page and '/XObject' in page['/Resources']:
+            x_object = page['/Resources']['/XObject'].get_object()
+
+            for obj_name in x_object:
+                obj = x_object[obj_name]
+                if obj.get('/Subtype') == '/Image':
+                    try:
+                        logger.debug(f"Extracting image object: {obj_name}")
+                        width = int(obj['/Width'])
+                        height = int(obj['/Height'])
+                        # Check the claimed size before decompressing or allocating anything
+                        if width * height > Image.MAX_IMAGE_PIXELS:
+                            logger.warning(
+                                f"Skipping oversized image object {obj_name}: {width}x{height}"
+                            )
+                            continue
+                        data = obj.get_data()
+
+                        # pypdf leaves JPEG streams encoded; decode them at preview scale
+                        filters = obj.get('/Filter')
+                        if filters == '/DCTDecode' or (
+                            isinstance(filters, list) and '/DCTDecode' in filters
+                        ):
+                            with Image.open(io.BytesIO(data)) as img:
+                                image = _pil_to_qimage(_downsize_for_preview(img))
+                            if not image.isNull():
+                                return image
+                            continue
+
+                        color_space = obj.get('/ColorSpace', '/DeviceRGB')
+
+                        if color_space == '/DeviceRGB':
+                            mode = "RGB"
+                        elif color_space == '/DeviceGray':
+                            mode = "L"
+                        elif color_space == '/DeviceCMYK':
+                            mode = "CMYK"
+                        else:
+                            mode = "RGB"
+
+                        if len(data) < width * height * Image.getmodebands(mode):
+                            raise ValueError("not enough image data")
+                        # Gray and CMYK images share the stream's buffer instead of copying it
+                        img = Image.frombuffer(mode, (width, height), data, "raw", mode, 0, 1)
+                        img = _downsize_for_preview(img)
+                        if img.mode == "CMYK":
+                            img = img.convert("RGB")
+
+                        image = _pil_to_qimage(img)
+                        if not image.isNull():
+                            return image
+                    except Exception as e:
+                        logger.warning(f"Fallback image extraction failed for {obj_name}: {e}")
+                        continue
+    except Exception as e:
+        logger.warning(f"PDF extraction structure error: {e}")
+        raise PreviewError(f"Could not extract content from PDF.\n{str(e)}") from e
+
+    raise PreviewError(f"PDF loaded but no images found on first page.\n{file_path.name}")
+
+
+# Preview loader for each supported file suffix
+_PREVIEW_LOADERS = {
+    **dict.fromkeys(IMAGE_SUFFIXES, _load_image_preview),
+    ".pdf": _load_pdf_preview,
+}
+
+
+@dataclass
+class FilingState:
+    """Filing suggestion shown in the viewer's edit fields and labels."""
+
+    filename: str = ""
+    destination: str = ""
+    confidence: float | None = None
+    reasoning: str | None = None
+
+
+def _preview_cache_key(file_path: Path) -> tuple[str, int] | None:
+    """Get the preview cache key of a file, which changes when the file is modified.
+
+    Args:
+        file_path: File to preview.
+
+    Returns:
+        (path, mtime_ns), or None if the file cannot be stat'ed.
+    """
+    try:
+        return (str(file_path), file_path.stat().st_mtime_ns)
+    except OSError:
+        return None
+
+
+def _pixmap_bytes(pixmap: QPixmap) -> int:
+    """Estimate the memory held by a pixmap.
+
+    Args:
+        pixmap: Pixmap to measure.
+
+    Returns:
+        Size of its pixel data in bytes.
+    """
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def _set_label_text(label: QLabel, text: str):
+    """Set a label's text unless it already shows it, avoiding a relayout.
+
+    Args:
+        label: Label to update.
+        text: New text.
+    """
+    if label.text() != text:
+        label.setText(text)
+
+
+class PreviewLoaderSignals(QObject):
+    """Signals of a PreviewLoader (QRunnable is not a QObject)."""
+
+    loaded = pyqtSignal(int, object)  # request id, QImage (or PreviewError)
+
+
+class PreviewLoader(QRunnable):
+    """Decodes a file preview on a QThreadPool."""
+
+    def __init__(self, request_id: int, file_path: Path):
+        """Initialize the loader.
+
+        Args:
+            request_id: Id passed back with the result, to recognize stale loads.
+            file_path: File to preview.
+        """
+        super().__init__()
+        # Deleted by FileViewerWidget once its result arrives or it is taken off the queue
+        self.setAutoDelete(False)
+        self.request_id = request_id
+        self.file_path = file_path
+        self.signals = PreviewLoaderSignals()
+
+    def run(self):
+        """Decode the preview."""
+        try:
+            self.signals.loaded.emit(self.request_id, load_preview_image(self.file_path))
+        except PreviewError as e:
+            self.signals.loaded.emit(self.request_id, e)
+
 
 class FileViewerWidget(QWidget):
     """Widget to display and edit a single document's filing information."""
@@ -42,13 +499,48 @@ class FileViewerWidget(QWidget):
         """Initialize the file viewer widget."""
         super().__init__(parent)
         self.source_dir = None
+        self._source_dir_path = None
         self._file_path = None
         self._is_skipped = False
         self._full_pixmap = QPixmap()
+        # Last smooth scaling of _full_pixmap, reused while the target size is unchanged
+        self._smooth_pixmap = QPixmap()
+        self._smooth_size = QSize()
         self._zoom_factor = 1.0
         self._fit_to_view = True
+        # LRU of decoded previews keyed by (path, mtime_ns)
+        self._preview_cache: OrderedDict[tuple[str, int], QPixmap] = OrderedDict()
+        self._preview_cache_bytes = 0
+        self._preview_key = None
+        # Id of the latest preview load; results of older loads are discarded
+        self._preview_request = 0
+        # Keys of previews being decoded ahead of time, by prefetch request id
+        self._prefetch_keys: dict[int, tuple[str, int]] = {}
+        self._prefetch_request = 0
+        # Every preview decode runs on this pool, so at most PREVIEW_MAX_LOADS run at once
+        self._loader_pool = QThreadPool(self)
+        self._loader_pool.setMaxThreadCount(PREVIEW_MAX_LOADS)
+        self._loaders = set()
+        # Load of the selected file; replaced by the next selection if it has not started
+        self._preview_loader = None
+        self._state = FilingState()
         self._init_ui()
 
+        # Applies _state to the widgets once per event-loop pass, coalescing updates
+        self._sync_timer = QTimer(self)
+        self._sync_timer.setSingleShot(True)
+        self._sync_timer.setInterval(0)
+        self._sync_timer.timeout.connect(self._sync_widgets)
+
+        # Delays the smooth redraw of the preview until zooming/resizing pauses
+        self._smooth_timer = QTimer(self)
+        self._smooth_timer.setSingleShot(True)
+        self._smooth_timer.timeout.connect(self._refine_preview)
+
+        # Coalesce keystrokes in the edit fields into one change signal per pause
+        self._filename_timer = self._create_debounce_timer(self._emit_filename_changed)
+        self._destination_timer = self._create_debounce_timer(self._emit_destination_changed)
+
     def _init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout(self)
@@ -144,157 +636,175 @@ class FileViewerWidget(QWidget):
     def set_file(self, file_path: str | Path):
         """Set the file to display.
 
+        The preview is decoded on a background thread; a placeholder is shown
+        until it arrives.
+
         Args:
             file_path: Path to the file.
         """
 
-        self._file_path = Path(file_path)
+        self._file_path = file_path if isinstance(file_path, Path) else Path(file_path)
         self.original_label.setText(self._file_path.name)
 
         logger.debug(f"Loading file: {self._file_path}")
 
-        # Try to load preview for images
-        if self._file_path.suffix.lower() in {".png", ".jpg", ".jpeg", ".bmp", ".tiff", ".tif"}:
-            try:
-                logger.debug(f"Loading image file with PIL optimization: {self._file_path}")
-
-                # Load and downsize using PIL before converting to QPixmap
-                with Image.open(str(self._file_path)) as img:
-                    # Target a reasonable preview size (e.g., 2000px)
-                    limit = 2000
-
-                    # Use draft mode for JPEGs to reduce memory usage during load
-                    if img.format == "JPEG" and (img.width > limit or img.height > limit):
-                        img.draft(None, (limit, limit))
-
-                    # If very large, downsize now (thumbnail() is memory efficient)
-                    if img.width > limit or img.height > limit:
-                        logger.debug(f"Downsizing large image for preview: {img.width}x{img.height}")
-                        img.thumbnail((limit, limit), Image.Resampling.LANCZOS)
-
-                    # Convert to QPixmap
-                    pixmap = self._pil_to_qpixmap(img)
-
-                if pixmap.isNull():
-                    raise ValueError("Failed to create QPixmap from image data")
-
-                self._full_pixmap = pixmap
-                self._zoom_factor = 1.0
-                self._fit_to_view = True
-                self._update_preview()
-                logger.debug(f"Successfully loaded image preview: {self._file_path.name}")
-
-            except Exception as e:
-                logger.error(f"Image preview loading failed for {self._file_path}: {e}", exc_info=True)
-                self.preview_label.setText(f"Could not load image\n{self._file_path.name}\n{str(e)}")
-                self._full_pixmap = QPixmap()
-
-        elif self._file_path.suffix.lower() == ".pdf":
-            # For PDFs, try multiple approaches
-            logger.debug(f"Loading PDF file: {self._file_path}")
-            try:
-                # Try using pdf2image first (most reliable for rendering)
-                try:
-                    logger.debug("Attempting PDF rendering with pdf2image")
-
-                    # Convert first page only (use a higher DPI for zooming headroom)
-                    images = convert_from_path(
-                        str(self._file_path),
-                        first_page=1,
-                        last_page=1,
-                        dpi=200,
-                        size=(1200, None)
-                    )
-
-                    if images:
-                        # Convert PIL Image to QPixmap
-                        img = images[0]
-                        pixmap = self._pil_to_qpixmap(img)
-
-                        if not pixmap.isNull():
-                            self._full_pixmap = pixmap
-                            self._zoom_factor = 1.0
-                            self._fit_to_view = True
-                            self._update_preview()
-                            logger.debug(f"Successfully rendered PDF with pdf2image: {self._file_path.name}")
-                            return
-                        else:
-                            logger.warning("pdf2image produced null pixmap")
-                    else:
-                        logger.warning("pdf2image returned no images")
-
-                except Exception as e:
-                    logger.warning(f"pdf2image failed: {e}")
-
-                # Fallback: Try extracting embedded images from PDF
-                logger.debug("Attempting PDF image extraction with pypdf")
-                pdf_reader = PdfReader(str(self._file_path))
+        # Any preview still loading for a previously selected file is now stale
+        self._preview_request += 1
+        self._cancel_queued_preview()
+
+        # Reuse the decoded preview if this file was shown before and is unchanged
+        self._preview_key = _preview_cache_key(self._file_path)
+        cached = self._preview_cache.get(self._preview_key)
+        if cached is not None:
+            self._preview_cache.move_to_end(self._preview_key)
+            logger.debug(f"Using cached preview: {self._file_path.name}")
+            self._show_pixmap(cached)
+            return
 
-                if len(pdf_reader.pages) > 0:
-                    page = pdf_reader.pages[0]
-                    images_found = False
+        self._full_pixmap = QPixmap()
 
-                    # Try to extract images from the page
-                    try:
-                        if '/Resources' in page and '/XObject' in page['/Resources']:
-                            x_object = page['/Resources']['/XObject'].get_object()
-
-                            for obj_name in x_object:
-                                obj = x_object[obj_name]
-                                if obj.get('/Subtype') == '/Image':
-                                    try:
-                                        logger.debug(f"Extracting image object: {obj_name}")
-                                        width = int(obj['/Width'])
-                                        height = int(obj['/Height'])
-                                        data = obj.get_data()
-                                        color_space = obj.get('/ColorSpace', '/DeviceRGB')
-
-                                        if color_space == '/DeviceRGB':
-                                            mode = "RGB"
-                                        elif color_space == '/DeviceGray':
-                                            mode = "L"
-                                        elif color_space == '/DeviceCMYK':
-                                            mode = "CMYK"
-                                        else:
-                                            mode = "RGB"
-
-                                        img = Image.frombytes(mode, (width, height), data)
-                                        if mode == "CMYK":
-                                            img = img.convert("RGB")
-
-                                        pixmap = self._pil_to_qpixmap(img)
-                                        if not pixmap.isNull():
-                                            self._full_pixmap = pixmap
-                                            self._zoom_factor = 1.0
-                                            self._fit_to_view = True
-                                            self._update_preview()
-                                            images_found = True
-                                            break
-                                    except Exception as e:
-                                        logger.warning(f"Fallback image extraction failed for {obj_name}: {e}")
-                                        continue
-
-                        if not images_found:
-                            self.preview_label.setText(f"PDF loaded but no images found on first page.\n{self._file_path.name}")
-                            self._full_pixmap = QPixmap()
-                    except Exception as e:
-                        logger.warning(f"PDF extraction structure error: {e}")
-                        self.preview_label.setText(f"Could not extract content from PDF.\n{str(e)}")
-                        self._full_pixmap = QPixmap()
-                else:
-                    self.preview_label.setText(f"PDF file has no pages.\n{self._file_path.name}")
-                    self._full_pixmap = QPixmap()
-
-            except Exception as e:
-                logger.error(f"PDF preview failed for {self._file_path}: {e}")
-                self.preview_label.setText(f"Could not load PDF preview.\n{str(e)}")
-                self._full_pixmap = QPixmap()
-        else:
+        suffix = self._file_path.suffix
+        if suffix.lower() not in PREVIEW_SUFFIXES:
             # For other file types, show placeholder
-            logger.debug(f"Unsupported file type: {self._file_path.suffix}")
+            logger.debug(f"Unsupported file type: {suffix}")
             self.preview_label.setText(f"File: {self._file_path.name}\n(Preview not available)")
+            return
+
+        self.preview_label.setText(f"Loading preview...\n{self._file_path.name}")
+
+        if self._preview_key in self._prefetch_keys.values():
+            return  # Already being decoded; shown by _on_prefetch_loaded
+
+        self._preview_loader = self._start_loader(
+            self._preview_request, self._file_path, self._on_preview_loaded, priority=1
+        )
+
+    def prefetch(self, paths: list[Path]):
+        """Decode previews of files likely to be shown next, in the background.
+
+        Decoded previews go into the preview cache, so selecting one of these
+        files shows its preview immediately.
+
+        At most PREFETCH_MAX_LOADS prefetches run at once; paths beyond that
+        are skipped, so list the most likely next file first.
+
+        Args:
+            paths: Files to preload, most likely first.
+        """
+        for path in paths:
+            if len(self._prefetch_keys) >= PREFETCH_MAX_LOADS:
+                break
+            if path.suffix.lower() not in PREVIEW_SUFFIXES:
+                continue
+            key = _preview_cache_key(path)
+            if key is None or key in self._preview_cache or key in self._prefetch_keys.values():
+                continue
+            self._prefetch_request += 1
+            self._prefetch_keys[self._prefetch_request] = key
+            self._start_loader(self._prefetch_request, path, self._on_prefetch_loaded)
+
+    def _start_loader(
+        self, request_id: int, file_path: Path, slot, priority: int = 0
+    ) -> PreviewLoader:
+        """Queue a preview decode on the loader pool.
+
+        Args:
+            request_id: Id passed back to the slot with the result.
+            file_path: File to preview.
+            slot: Receives the loader's loaded signal.
+            priority: Pool queue priority; the selected file goes ahead of prefetches.
+
+        Returns:
+            The queued loader.
+        """
+        loader = PreviewLoader(request_id, file_path)
+        loader.signals.loaded.connect(slot)
+        # Keep a reference until the result arrives, even if it is stale
+        self._loaders.add(loader)
+        loader.signals.loaded.connect(lambda: self._loaders.discard(loader))
+        self._loader_pool.start(loader, priority)
+        return loader
+
+    def _cancel_queued_preview(self):
+        """Take the previous selection's load off the pool queue if it has not started yet."""
+        loader, self._preview_loader = self._preview_loader, None
+        if loader is not None and self._loader_pool.tryTake(loader):
+            self._loaders.discard(loader)
+
+    def _on_preview_loaded(self, request_id: int, result: object):
+        """Show a preview decoded by a PreviewLoader.
+
+        Args:
+            request_id: Request the preview belongs to.
+            result: Decoded QImage, or PreviewError describing the failure.
+        """
+        if request_id != self._preview_request:
+            return  # Another file was selected in the meantime
+
+        if isinstance(result, PreviewError):
+            self.preview_label.setText(str(result))
             self._full_pixmap = QPixmap()
+            return
 
+        self._show_pixmap(QPixmap.fromImage(result))
+        logger.debug(f"Successfully loaded preview: {self._file_path.name}")
+
+    def _on_prefetch_loaded(self, request_id: int, result: object):
+        """Cache a preview decoded ahead of time, showing it if its file is now selected.
+
+        Args:
+            request_id: Prefetch request the preview belongs to.
+            result: Decoded QImage, or PreviewError describing the failure.
+        """
+        key = self._prefetch_keys.pop(request_id)
+        # set_file left the placeholder up for this result if the file is still selected
+        waiting = key == self._preview_key and self._full_pixmap.isNull()
+
+        if isinstance(result, PreviewError):
+            if waiting:
+                self.preview_label.setText(str(result))
+            return
+
+        pixmap = QPixmap.fromImage(result)
+        if waiting:
+            self._show_pixmap(pixmap)
+        else:
+            self._cache_preview(key, pixmap)
+
+    def _show_pixmap(self, pixmap: QPixmap):
+        """Display a decoded preview fitted to the view, and cache it for the current file.
+
+        Args:
+            pixmap: Full-size preview of the current file.
+        """
+        self._full_pixmap = pixmap
+        self._smooth_pixmap = QPixmap()
+        self._smooth_size = QSize()
+        self._zoom_factor = 1.0
+        self._fit_to_view = True
+        self._update_preview()
+
+        if self._preview_key is not None:
+            self._cache_preview(self._preview_key, pixmap)
+
+    def _cache_preview(self, key: tuple[str, int], pixmap: QPixmap):
+        """Store a decoded preview in the LRU preview cache.
+
+        Args:
+            key: Cache key from _preview_cache_key.
+            pixmap: Full-size preview.
+        """
+        replaced = self._preview_cache.pop(key, None)
+        if replaced is not None:
+            self._preview_cache_bytes -= _pixmap_bytes(replaced)
+        self._preview_cache[key] = pixmap
+        self._preview_cache_bytes += _pixmap_bytes(pixmap)
+        while (
+            len(self._preview_cache) > PREVIEW_CACHE_SIZE
+            or self._preview_cache_bytes > PREVIEW_CACHE_MAX_BYTES
+        ):
+            _, evicted = self._preview_cache.popitem(last=False)
+            self._preview_cache_bytes -= _pixmap_bytes(evicted)
 
     def set_suggestion(
         self,
@@ -305,38 +815,22 @@ class FileViewerWidget(QWidget):
     ):
         """Set the filing suggestion.
 
+        The widgets are updated on the next event-loop pass, so repeated calls
+        in a row only redraw once.
+
         Args:
             filename: Suggested filename.
             destination: Suggested destination path.
             confidence: Confidence score (0-1).
             reasoning: Explanation of the suggestion.
         """
-        self.filename_edit.setText(filename)
-        self.dest_edit.setText(destination)
-        self.confidence_label.setText(f"Confidence: {confidence:.1%}")
-        self.reasoning_label.setText(f"Reasoning: {reasoning}")
+        self._state = FilingState(filename, destination, confidence, reasoning)
+        self._sync_timer.start()
 
     def clear_suggestion(self):
         """Clear the current filing suggestion."""
-        self.filename_edit.clear()
-        self.dest_edit.clear()
-        self.confidence_label.setText("Confidence: -")
-        self.reasoning_label.setText("Reasoning: -")
-
-    def _pil_to_qpixmap(self, img: Image.Image) -> QPixmap:
-        """Convert PIL Image to QPixmap.
-
-        Args:
-            img: PIL Image object.
-
-        Returns:
-            QPixmap object.
-        """
-        img_byte_arr = io.BytesIO()
-        img.save(img_byte_arr, format='PNG')
-        pixmap = QPixmap()
-        pixmap.loadFromData(img_byte_arr.getvalue())
-        return pixmap
+        self._state = FilingState()
+        self._sync_timer.start()
 
     def get_filename(self) -> str:
         """Get the current filename.
@@ -344,6 +838,7 @@ class FileViewerWidget(QWidget):
         Returns:
             Current filename from the edit field.
         """
+        self._sync_pending_state()
         return self.filename_edit.text()
 
     def get_destination(self) -> str:
@@ -352,8 +847,33 @@ class FileViewerWidget(QWidget):
         Returns:
             Current destination from the edit field.
         """
+        self._sync_pending_state()
         return self.dest_edit.text()
 
+    def _sync_pending_state(self):
+        """Apply a suggestion whose widget update is still scheduled."""
+        if self._sync_timer.isActive():
+            self._sync_timer.stop()
+            self._sync_widgets()
+
+    def _sync_widgets(self):
+        """Show _state in the edit fields and labels, touching only what changed."""
+        state = self._state
+        self._set_edit_texts(state.filename, state.destination)
+        confidence = "-" if state.confidence is None else f"{state.confidence:.1%}"
+        _set_label_text(self.confidence_label, f"Confidence: {confidence}")
+        reasoning = "-" if state.reasoning is None else state.reasoning
+        _set_label_text(self.reasoning_label, f"Reasoning: {reasoning}")
+
+    def set_source_dir(self, source_dir: str | Path | None):
+        """Set the folder that browsed destinations are made relative to.
+
+        Args:
+            source_dir: Source folder, or None to use absolute destinations.
+        """
+        self.source_dir = source_dir
+        self._source_dir_path = Path(source_dir) if source_dir else None
+
     def is_skipped(self) -> bool:
         """Check if this file is marked to be skipped.
 
@@ -365,18 +885,25 @@ class FileViewerWidget(QWidget):
     def reset(self):
         """Reset the viewer to empty state."""
         self._file_path = None
+        self._preview_key = None
+        self._preview_request += 1
+        self._cancel_queued_preview()
+        self._smooth_timer.stop()
+        self._full_pixmap = QPixmap()
+        self._smooth_pixmap = QPixmap()
+        self._smooth_size = QSize()
         self._is_skipped = False
         self.preview_label.setText("No file selected")
         self.preview_label.setPixmap(QPixmap())  # Clear pixmap
         self.original_label.setText("-")
-        self.filename_edit.clear()
-        self.dest_edit.clear()
-        self.confidence_label.setText("Confidence: -")
-        self.reasoning_label.setText("Reasoning: -")
+        self._state = FilingState()
+        self._sync_timer.stop()
+        self._sync_widgets()
         self.skip_button.setChecked(False)
 
     def _on_skip_clicked(self, checked: bool):
         """Handle skip button click."""
+        self._sync_pending_state()
         self._is_skipped = checked
 
         if checked:
@@ -395,12 +922,9 @@ class FileViewerWidget(QWidget):
 
     def _on_browse_clicked(self):
         """Handle browse button click."""
+        self._sync_pending_state()
         # Use source_dir as start, or fallback to current dest or home
-        start_dir = self.source_dir
-        if not start_dir:
-            start_dir = Path.home()
-        else:
-            start_dir = Path(start_dir)
+        start_dir = self._source_dir_path or Path.home()
 
         current_dest = self.dest_edit.text().strip()
         if current_dest:
@@ -418,9 +942,9 @@ class FileViewerWidget(QWidget):
         if folder:
             folder_path = Path(folder)
             # Try to make relative to source_dir if possible
-            if self.source_dir:
+            if self._source_dir_path:
                 try:
-                    rel_path = folder_path.relative_to(Path(self.source_dir))
+                    rel_path = folder_path.relative_to(self._source_dir_path)
                     self.dest_edit.setText(str(rel_path))
                     return
                 except ValueError:
@@ -430,29 +954,65 @@ class FileViewerWidget(QWidget):
             # Fallback to full path
             self.dest_edit.setText(str(folder_path))
 
-    def _update_preview(self):
-        """Update the preview image based on current zoom and fit settings."""
+    def _update_preview(self, smooth_delay_ms: int = SMOOTH_PREVIEW_DELAY_MS):
+        """Update the preview image based on current zoom and fit settings.
+
+        A fast (nearest-neighbour) scaling is shown right away; the smooth one
+        replaces it once zooming or resizing pauses.
+
+        Args:
+            smooth_delay_ms: Pause after which the smooth scaling is drawn.
+        """
+        if self._full_pixmap.isNull():
+            return
+
+        target_size = self._preview_target_size()
+        if target_size == self._smooth_size:
+            # Already smoothly scaled to this size (e.g. a resize that kept the viewport)
+            self._smooth_timer.stop()
+            self._display_scaled(self._smooth_pixmap)
+            return
+
+        self._display_scaled(self._full_pixmap.scaled(
+            target_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.FastTransformation
+        ))
+        self._smooth_timer.start(smooth_delay_ms)
+
+    def _refine_preview(self):
+        """Redraw the preview with smooth scaling."""
         if self._full_pixmap.isNull():
             return
 
+        target_size = self._preview_target_size()
+        self._smooth_pixmap = self._full_pixmap.scaled(
+            target_size,
+            Qt.AspectRatioMode.KeepAspectRatio,
+            Qt.TransformationMode.SmoothTransformation
+        )
+        self._smooth_size = target_size
+        self._display_scaled(self._smooth_pixmap)
+
+    def _preview_target_size(self) -> QSize:
+        """Get the size the full preview is scaled into for the current zoom.
+
+        Returns:
+            The scroll area's viewport size when fitting to view, else the zoomed size.
+        """
+        if self._fit_to_view:
+            return self.scroll_area.viewport().size()
+        return self._full_pixmap.size() * self._zoom_factor
+
+    def _display_scaled(self, scaled: QPixmap):
+        """Display a scaled preview.
+
+        Args:
+            scaled: The full preview scaled into _preview_target_size().
+        """
         if self._fit_to_view:
-            # Calculate zoom factor to fit the scroll area
-            area_size = self.scroll_area.viewport().size()
-            scaled = self._full_pixmap.scaled(
-                area_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
             # Update internal zoom factor to match
             self._zoom_factor = scaled.width() / self._full_pixmap.width()
-        else:
-            # Apply manual zoom factor
-            new_size = self._full_pixmap.size() * self._zoom_factor
-            scaled = self._full_pixmap.scaled(
-                new_size,
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation
-            )
 
         self.preview_label.setPixmap(scaled)
         self.preview_label.resize(scaled.size())
@@ -461,7 +1021,7 @@ class FileViewerWidget(QWidget):
         """Increase zoom factor."""
         self._fit_to_view = False
         self._zoom_factor *= 1.2
-        self._update_preview()
+        self._update_preview(INTERACTIVE_SMOOTH_DELAY_MS)
 
     def zoom_out(self):
         """Decrease zoom factor."""
@@ -469,7 +1029,7 @@ class FileViewerWidget(QWidget):
         self._zoom_factor /= 1.2
         # Minimum zoom 10%
         self._zoom_factor = max(0.1, self._zoom_factor)
-        self._update_preview()
+        self._update_preview(INTERACTIVE_SMOOTH_DELAY_MS)
 
     def reset_zoom(self):
         """Reset to Fit to View mode."""
@@ -480,7 +1040,7 @@ class FileViewerWidget(QWidget):
         """Handle resize events to update Fit to View."""
         super().resizeEvent(event)
         if self._fit_to_view:
-            self._update_preview()
+            self._update_preview(INTERACTIVE_SMOOTH_DELAY_MS)
 
     def wheelEvent(self, event):
         """Handle mouse wheel for zooming with Ctrl."""
@@ -494,10 +1054,64 @@ class FileViewerWidget(QWidget):
         else:
             super().wheelEvent(event)
 
-    def _on_filename_changed(self, text: str):
-        """Handle filename text change."""
-        self.filename_changed.emit(text)
+    def flush_pending_edits(self):
+        """Emit filename/destination edits that are still waiting out the debounce delay.
+
+        Call before switching files or acting on the edited values.
+        """
+        # A scheduled suggestion overrides edits made before it was set
+        self._sync_pending_state()
+        if self._filename_timer.isActive():
+            self._filename_timer.stop()
+            self._emit_filename_changed()
+        if self._destination_timer.isActive():
+            self._destination_timer.stop()
+            self._emit_destination_changed()
+
+    def _set_edit_texts(self, filename: str, destination: str):
+        """Fill the edit fields programmatically without emitting change signals.
 
-    def _on_destination_changed(self, text: str):
-        """Handle destination text change."""
-        self.destination_changed.emit(text)
+        Args:
+            filename: Filename text.
+            destination: Destination text.
+        """
+        # Edits not yet emitted are superseded by the new text
+        self._filename_timer.stop()
+        self._destination_timer.stop()
+        if self.filename_edit.text() != filename:
+            with QSignalBlocker(self.filename_edit):
+                self.filename_edit.setText(filename)
+        if self.dest_edit.text() != destination:
+            with QSignalBlocker(self.dest_edit):
+                self.dest_edit.setText(destination)
+
+    def _create_debounce_timer(self, callback) -> QTimer:
+        """Create a single-shot timer that calls back once edits pause.
+
+        Args:
+            callback: Called when the timer fires.
+
+        Returns:
+            The timer; start() restarts the delay.
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(EDIT_DEBOUNCE_MS)
+        timer.timeout.connect(callback)
+        return timer
+
+    def _on_filename_changed(self, _text: str):
+        """Handle filename text change; emitted once typing pauses."""
+        self._filename_timer.start()
+
+    def _on_destination_changed(self, _text: str):
+        """Handle destination text change; emitted once typing pauses."""
+        self._destination_timer.start()
+
+    def _emit_filename_changed(self):
+        """Emit the current filename."""
+        self.filename_changed.emit(self.filename_edit.text())
+
+    def _emit_destination_changed(self):
+        """Emit the current destination."""
+        self.destination_changed.emit(self.dest_edit.text())
@@ -8,6 +8,7 @@ import logging
 import os
 import signal
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -33,6 +34,13 @@ from .file_viewer import FileViewerWidget
 
 logger = logging.getLogger(__name__)
 
+# Number of documents sent to the VLM provider concurrently
+MAX_CONCURRENT_REQUESTS = 4
+
+# Number of files after the selected one whose previews are decoded ahead of time
+# (the file before it is prefetched too)
+PREVIEW_PREFETCH_COUNT = 2
+
 
 class CheckableListView(QListView):
     """QListView that supports shift-click for mass checkbox toggling."""
@@ -92,31 +100,61 @@ class ProcessingThread(QThread):
     file_processed = pyqtSignal(str, object)  # file_path, suggestion (or exception)
     finished = pyqtSignal()
 
-    def __init__(self, files, vlm_service):
+    def __init__(self, files, vlm_service, max_workers: int = MAX_CONCURRENT_REQUESTS):
         """Initialize the processing thread.
 
         Args:
             files: List of file paths to process.
             vlm_service: VLM service instance.
+            max_workers: Maximum number of documents analyzed concurrently.
         """
         super().__init__()
         self.files = files
         self.vlm_service = vlm_service
+        self.max_workers = max_workers
+        self._futures = {}
+
+    def stop(self):
+        """Ask the thread to stop, cancelling documents that have not started yet.
+
+        Requests already in flight cannot be cancelled and are left to finish;
+        their results are discarded.
+        """
+        self.requestInterruption()
+        for future in list(self._futures):
+            future.cancel()
 
     def run(self):
-        """Run the processing in background."""
+        """Run the processing in background.
+
+        Requests are network-bound, so several documents are analyzed at once
+        to overlap API latency. Results are emitted as they complete. finished
+        is emitted whether the batch completes or is stopped.
+        """
         total = len(self.files)
 
-        for idx, file_path in enumerate(self.files, 1):
-            try:
-                suggestion = self.vlm_service.analyze_document(file_path)
-                self.file_processed.emit(str(file_path), suggestion)
-            except Exception as e:
-                self.file_processed.emit(str(file_path), e)
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                self._futures = {
+                    executor.submit(self.vlm_service.analyze_document, file_path): file_path
+                    for file_path in self.files
+                }
+
+                for idx, future in enumerate(as_completed(self._futures), 1):
+                    if self.isInterruptionRequested():
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        logger.info("Processing stopped; pending documents cancelled")
+                        return
 
-            self.progress.emit(idx, total)
+                    file_path = self._futures[future]
+                    try:
+                        self.file_processed.emit(str(file_path), future.result())
+                    except Exception as e:
+                        self.file_processed.emit(str(file_path), e)
 
-        self.finished.emit()
+                    self.progress.emit(idx, total)
+        finally:
+            self.finished.emit()
 
 
 class ContextGenerationThread(QThread):
@@ -254,7 +292,7 @@ class MainWindow(QMainWindow):
 
             # Update file viewer with source dir
             if self.config.source_dir:
-                self.file_viewer.source_dir = self.config.source_dir
+                self.file_viewer.set_source_dir(self.config.source_dir)
 
         except Exception as e:
             logger.error(f"Failed to load configuration: {e}")
@@ -289,6 +327,9 @@ class MainWindow(QMainWindow):
         folder = Path(folder_path)
         logger.info(f"Loading folder: {folder}")
 
+        # Pending edits must reach the current file before the list changes
+        self.file_viewer.flush_pending_edits()
+
         # Find all supported files
         patterns = ["*.pdf", "*.png", "*.jpg", "*.jpeg", "*.tiff", "*.tif", "*.bmp"]
         self.files = []
@@ -337,11 +378,15 @@ class MainWindow(QMainWindow):
         if row < 0 or row >= len(self.files):
             return
 
+        # Pending edits belong to the previously selected file
+        self.file_viewer.flush_pending_edits()
+
         self.current_file_index = row
         file_path = self.files[row]
 
-        # Update viewer
+        # Update viewer, and start decoding the files likely to be viewed next
         self.file_viewer.set_file(file_path)
+        self.file_viewer.prefetch(self._prefetch_candidates(row))
 
         # If we have a suggestion for this file, display it
         if str(file_path) in self.suggestions:
@@ -360,6 +405,19 @@ class MainWindow(QMainWindow):
             # No suggestion at all for this file
             self.file_viewer.clear_suggestion()
 
+    def _prefetch_candidates(self, row: int) -> list[Path]:
+        """Get the files around a row whose previews are worth decoding ahead of time.
+
+        Args:
+            row: Row of the selected file.
+
+        Returns:
+            The next file, then the previous one, then the files further ahead.
+        """
+        ahead = self.files[row + 1 : row + 1 + PREVIEW_PREFETCH_COUNT]
+        behind = self.files[row - 1 : row] if row > 0 else []
+        return ahead[:1] + behind + ahead[1:]
+
     def _on_viewer_filename_changed(self, text):
         """Handle manual filename changes in the viewer."""
         if self.current_file_index >= 0:
@@ -514,6 +572,7 @@ class MainWindow(QMainWindow):
 
     def _execute_rename(self):
         """Rename selected files in place (same directory)."""
+        self.file_viewer.flush_pending_edits()
         selected = self._get_selected_files()
 
         if not selected:
@@ -588,6 +647,7 @@ class MainWindow(QMainWindow):
 
     def _execute_move(self):
         """Move selected files to their suggested destinations."""
+        self.file_viewer.flush_pending_edits()
         selected = self._get_selected_files()
 
         if not selected:
@@ -665,6 +725,9 @@ class MainWindow(QMainWindow):
         folder = Path(folder_path)
         logger.debug(f"Refreshing folder: {folder}")
 
+        # Pending edits must reach the current file before the list changes
+        self.file_viewer.flush_pending_edits()
+
         # Find all supported files
         patterns = ["*.pdf", "*.png", "*.jpg", "*.jpeg", "*.tiff", "*.tif", "*.bmp"]
         self.files = []
@@ -774,6 +837,13 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 logger.error(f"Failed to refresh VLM service: {e}")
 
+    def closeEvent(self, event):
+        """Stop background processing before the window closes."""
+        if self.processing_thread is not None and self.processing_thread.isRunning():
+            self.processing_thread.stop()
+            self.processing_thread.wait()
+        super().closeEvent(event)
+
 
 
 def main():
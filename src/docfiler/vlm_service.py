@@ -7,6 +7,7 @@ filename and destination suggestions from VLM providers.
 import json
 import logging
 import os
+import uuid
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -87,9 +88,10 @@ class VLMService:
         # Cache prompt to logs/
         log_dir = Path(__file__).parent.parent.parent / "logs"
         os.makedirs(log_dir, exist_ok=True)
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Documents are analyzed concurrently, so the name needs more than a seconds timestamp
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
         safe_filename = "".join(x for x in file_path.name if x.isalnum() or x in "._- ")
-        cache_file = log_dir / f"prompt_{timestamp}_{safe_filename}.md"
+        cache_file = log_dir / f"prompt_{timestamp}_{uuid.uuid4().hex[:8]}_{safe_filename}.md"
 
         with open(cache_file, "w", encoding="utf-8") as f:
             f.write(f"# Prompt Cache: {file_path.name}\n\n")
@@ -1,29 +1,35 @@
 """Unit tests for API client module."""
 
+import base64
 import json
 from unittest.mock import Mock, patch
 
 import pytest
 
-from docfiler.api_clients import ClaudeClient, GeminiClient, OpenAIClient, create_client
+from docfiler.api_clients import (
+    ClaudeClient,
+    GeminiClient,
+    OpenAIClient,
+    _Base64Cache,
+    _parse_json_response,
+    create_client,
+)
 
 
-class TestClaudeClient:
-    """Tests for Claude API client."""
+class TestParseJsonResponse:
+    """Tests for model response JSON parsing."""
 
     def test_parse_json_response_plain(self):
         """Test parsing plain JSON response."""
-        client = ClaudeClient("test_key", "test_model")
         response = '{"filename": "test.pdf", "destination": "docs"}'
 
-        result = client._parse_json_response(response)
+        result = _parse_json_response(response)
 
         assert result["filename"] == "test.pdf"
         assert result["destination"] == "docs"
 
     def test_parse_json_response_with_markdown(self):
         """Test parsing JSON in markdown code block."""
-        client = ClaudeClient("test_key", "test_model")
         response = """```json
 {
   "filename": "2024-01-01_test.pdf",
@@ -31,18 +37,43 @@ class TestClaudeClient:
 }
 ```"""
 
-        result = client._parse_json_response(response)
+        result = _parse_json_response(response)
 
         assert result["filename"] == "2024-01-01_test.pdf"
         assert result["destination"] == "finances/bills"
 
+    def test_parse_json_response_with_generic_fence(self):
+        """Test parsing JSON in a generic or unterminated code block."""
+        assert _parse_json_response('```\n{"filename": "a.pdf"}\n```') == {"filename": "a.pdf"}
+        assert _parse_json_response('```json\n{"filename": "b.pdf"}') == {"filename": "b.pdf"}
+
     def test_parse_json_response_invalid(self):
         """Test error on invalid JSON."""
-        client = ClaudeClient("test_key", "test_model")
         response = "This is not JSON"
 
         with pytest.raises(ValueError, match="Invalid JSON response"):
-            client._parse_json_response(response)
+            _parse_json_response(response)
+
+
+class TestBase64Cache:
+    """Tests for the per-client base64 page cache."""
+
+    def test_encode_reuses_and_evicts(self):
+        """Test that repeated pages hit the cache and the oldest entry is evicted."""
+        cache = _Base64Cache(maxsize=2)
+
+        first = cache.encode(b"page-1")
+        assert first == base64.b64encode(b"page-1").decode("ascii")
+        assert cache.encode(b"page-1") is first
+
+        cache.encode(b"page-2")
+        cache.encode(b"page-3")
+        assert len(cache._entries) == 2
+        assert cache.encode(b"page-1") is not first
+
+
+class TestClaudeClient:
+    """Tests for Claude API client."""
 
     @patch("docfiler.api_clients.anthropic.Anthropic")
     def test_analyze_document(self, mock_anthropic):
@@ -72,6 +103,36 @@ class TestClaudeClient:
         assert result["destination"] == "docs"
         assert mock_client.messages.create.called
 
+    @patch("docfiler.api_clients.anthropic.Anthropic")
+    def test_analyze_document_encodes_images(self, mock_anthropic):
+        """Test images are sent as standard base64."""
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+        mock_client.messages.create.return_value = Mock(content=[Mock(text="{}")])
+
+        client = ClaudeClient("test_key", "claude-3-5-sonnet-20241022")
+        client.analyze_document("Test prompt", [b"\xff\xfe binary image"])
+
+        content = mock_client.messages.create.call_args.kwargs["messages"][0]["content"]
+        assert content[0]["source"]["data"] == base64.standard_b64encode(
+            b"\xff\xfe binary image"
+        ).decode("ascii")
+
+    @patch("docfiler.api_clients.anthropic.Anthropic")
+    def test_generate_text(self, mock_anthropic):
+        """Test text-only generation with Claude."""
+        mock_client = Mock()
+        mock_anthropic.return_value = mock_client
+        mock_client.messages.create.return_value = Mock(content=[Mock(text="Context")])
+
+        client = ClaudeClient("test_key", "claude-3-5-sonnet-20241022")
+        result = client.generate_text("Describe folders", max_tokens=2048)
+
+        assert result == "Context"
+        kwargs = mock_client.messages.create.call_args.kwargs
+        assert kwargs["max_tokens"] == 2048
+        assert kwargs["messages"] == [{"role": "user", "content": "Describe folders"}]
+
 
 class TestOpenAIClient:
     """Tests for OpenAI API client."""
@@ -106,6 +167,23 @@ class TestOpenAIClient:
         assert result["destination"] == "files"
         assert mock_client.chat.completions.create.called
 
+    @patch("docfiler.api_clients.OpenAI")
+    def test_generate_text_completion_tokens(self, mock_openai):
+        """Test newer OpenAI models use max_completion_tokens."""
+        mock_client = Mock()
+        mock_openai.return_value = mock_client
+        mock_client.chat.completions.create.return_value = Mock(
+            choices=[Mock(message=Mock(content="Context"))]
+        )
+
+        client = OpenAIClient("test_key", "gpt-5-mini")
+        result = client.generate_text("Describe folders", max_tokens=2048)
+
+        assert result == "Context"
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs["max_completion_tokens"] == 2048
+        assert "max_tokens" not in kwargs
+
 
 class TestGeminiClient:
     """Tests for Gemini API client."""
@@ -134,6 +212,20 @@ class TestGeminiClient:
         assert result["destination"] == "test_dir"
         assert mock_client.models.generate_content.called
 
+    @patch("docfiler.api_clients.genai")
+    def test_generate_text(self, mock_genai):
+        """Test text-only generation with Gemini."""
+        mock_client = Mock()
+        mock_genai.Client.return_value = mock_client
+        mock_client.models.generate_content.return_value = Mock(text="Context")
+
+        client = GeminiClient("test_key", "gemini-2.0-flash-exp")
+        result = client.generate_text("Describe folders")
+
+        assert result == "Context"
+        kwargs = mock_client.models.generate_content.call_args.kwargs
+        assert kwargs["contents"] == "Describe folders"
+
 
 class TestCreateClient:
     """Tests for client factory function."""
@@ -153,6 +245,12 @@ class TestCreateClient:
         client = create_client("gemini", "test_key", "gemini-2.0-flash-exp")
         assert isinstance(client, GeminiClient)
 
+    def test_create_client_reuses_instance(self):
+        """Test that identical arguments return the same client."""
+        client = create_client("openai", "test_key", "gpt-4o")
+        assert create_client("openai", "test_key", "gpt-4o") is client
+        assert create_client("openai", "other_key", "gpt-4o") is not client
+
     def test_create_invalid_provider(self):
         """Test error with invalid provider."""
         with pytest.raises(ValueError, match="Unsupported provider"):
@@ -5,7 +5,7 @@ from unittest.mock import patch
 
 import pytest
 
-from docfiler.config import Config, load_config
+from docfiler.config import Config, clear_config_cache, load_config
 
 
 class TestConfig:
@@ -26,7 +26,7 @@ class TestConfig:
             pdf_pages_to_extract=3,
             vlm_max_tokens=1024,
             source_dir=None,
-            scan_ignore_patterns=[],
+            scan_ignore_patterns=(),
             default_dest_base=None,
             log_level="INFO",
         )
@@ -48,7 +48,7 @@ class TestConfig:
             pdf_pages_to_extract=3,
             vlm_max_tokens=1024,
             source_dir=None,
-            scan_ignore_patterns=[],
+            scan_ignore_patterns=(),
             default_dest_base=None,
             log_level="INFO",
         )
@@ -71,17 +71,45 @@ class TestConfig:
             pdf_pages_to_extract=3,
             vlm_max_tokens=1024,
             source_dir=None,
-            scan_ignore_patterns=[],
+            scan_ignore_patterns=(),
             default_dest_base=None,
             log_level="INFO",
         )
 
         assert config.active_model == "gpt-4o"
 
+    def test_unknown_provider(self):
+        """Test that an unsupported provider is rejected on construction."""
+        with pytest.raises(ValueError, match="Unknown VLM provider"):
+            Config(
+                vlm_provider="mistral",
+                anthropic_api_key=None,
+                openai_api_key=None,
+                gemini_api_key=None,
+                claude_model="claude-3-5-sonnet-20241022",
+                openai_model="gpt-4o",
+                gemini_model="gemini-2.0-flash-exp",
+                image_dpi=300,
+                max_image_dimension=2048,
+                pdf_pages_to_extract=3,
+                vlm_max_tokens=1024,
+                source_dir=None,
+                scan_ignore_patterns=(),
+                default_dest_base=None,
+                log_level="INFO",
+            )
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        """Load a fresh config in every test."""
+        clear_config_cache()
+        yield
+        clear_config_cache()
+
     @patch.dict(
         os.environ,
         {
@@ -148,3 +176,14 @@ class TestLoadConfig:
         """Test error with negative DPI."""
         with pytest.raises(ValueError, match="IMAGE_DPI must be positive"):
             load_config()
+
+    @patch.dict(os.environ, {"VLM_PROVIDER": "claude", "ANTHROPIC_API_KEY": "test_key"})
+    def test_load_config_memoized(self):
+        """Test that config is reused until the cache is cleared."""
+        config = load_config()
+        assert load_config() is config
+
+        with patch.dict(os.environ, {"ANTHROPIC_API_KEY": "new_key"}):
+            assert load_config().anthropic_api_key == "test_key"
+            clear_config_cache()
+            assert load_config().anthropic_api_key == "new_key"
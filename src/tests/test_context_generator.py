@@ -0,0 +1,207 @@
+"""Unit tests for context generator module."""
+
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from docfiler.cli import context_generator
+from docfiler.cli.context_generator import (
+    ContextGeneratorArgs,
+    ScanCache,
+    enumerate_folder_structure,
+    format_folder_info,
+    generate_context,
+)
+
+
+@pytest.fixture(autouse=True)
+def results_paths(tmp_path_factory, monkeypatch):
+    """Write raw scan results to a temporary directory (outside the scanned tree), not src/data."""
+    results_path = tmp_path_factory.mktemp("results") / "source_scanned_results.txt"
+    monkeypatch.setattr(context_generator, "RESULTS_PATH", results_path)
+    monkeypatch.setattr(
+        context_generator, "RESULTS_PATH_ZSTD", results_path.with_name(results_path.name + ".zst")
+    )
+
+
+def _make_tree(root, layout):
+    """Create directories and empty files under root.
+
+    Args:
+        root: Directory to create the tree in.
+        layout: Directory path relative to root -> file names in it.
+    """
+    for relative_dir, names in layout.items():
+        directory = root / relative_dir
+        directory.mkdir(parents=True, exist_ok=True)
+        for name in names:
+            (directory / name).touch()
+
+
+def _age_directories(root, seconds=60):
+    """Move directory mtimes into the past, so a later change always gets a new mtime."""
+    past_ns = os.stat(root).st_mtime_ns - seconds * 1_000_000_000
+    for dir_path, _dirs, _files in os.walk(root):
+        os.utime(dir_path, ns=(past_ns, past_ns))
+
+
+class TestScanCache:
+    """Tests for the SQLite cache of directory listings."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.layout = {"docs": ["a.pdf", "b.pdf"], "docs/2024": ["c.pdf"]}
+
+    def _scan(self, root, cache_path):
+        """Scan root with a call counter on os.scandir.
+
+        Returns:
+            Tuple of (structure, number of directories actually listed).
+        """
+        with patch.object(context_generator.os, "scandir", wraps=os.scandir) as scandir:
+            structure, _ = enumerate_folder_structure(root, cache_path=cache_path)
+        return structure, scandir.call_count
+
+    def test_cache_hit_when_unchanged(self, tmp_path):
+        """Test that a second scan of an unchanged tree lists no directory."""
+        root = tmp_path / "tree"
+        _make_tree(root, self.layout)
+        _age_directories(root)
+        cache_path = tmp_path / "cache.sqlite"
+
+        first, listed = self._scan(root, cache_path)
+        assert listed == 3
+
+        second, listed = self._scan(root, cache_path)
+        assert listed == 0
+        assert second == first
+
+    def test_cache_invalidated_by_new_file(self, tmp_path):
+        """Test that adding a file re-lists only the directory whose mtime changed."""
+        root = tmp_path / "tree"
+        _make_tree(root, self.layout)
+        _age_directories(root)
+        cache_path = tmp_path / "cache.sqlite"
+        self._scan(root, cache_path)
+
+        (root / "docs" / "2024" / "d.pdf").touch()
+        structure, listed = self._scan(root, cache_path)
+
+        assert listed == 1
+        assert sorted(structure[os.path.join("docs", "2024")]) == ["c.pdf", "d.pdf"]
+
+    def test_reopen_existing_cache(self, tmp_path):
+        """Test that listings survive closing and reopening the cache file."""
+        cache_path = tmp_path / "cache.sqlite"
+        cache = ScanCache(cache_path)
+        cache.put("/docs", 123, ["a.pdf", "b.pdf"], ["2024"])
+        cache.close()
+
+        reopened = ScanCache(cache_path)
+        try:
+            assert reopened.get("/docs", 123) == (["a.pdf", "b.pdf"], ["2024"])
+            assert reopened.get("/docs", 456) is None
+        finally:
+            reopened.close()
+
+    def test_scan_cache_disabled_by_default(self, tmp_path, monkeypatch):
+        """Test that without --scan_cache no cache database is created."""
+        assert ContextGeneratorArgs().scan_cache is False
+
+        root = tmp_path / "tree"
+        _make_tree(root, self.layout)
+        cache_path = tmp_path / "cache.sqlite"
+        monkeypatch.setattr(context_generator, "SCAN_CACHE_PATH", cache_path)
+        config = Mock(scan_ignore_patterns=(), vlm_max_tokens=1024)
+
+        with patch.object(context_generator, "create_client") as mock_create_client:
+            mock_create_client.return_value.generate_text.return_value = "Context"
+            context = generate_context(root, tmp_path / "context.md", config=config)
+
+        assert context == "Context"
+        assert not cache_path.exists()
+
+
+class TestEnumerateFolderStructure:
+    """Tests for the breadth-first directory scan."""
+
+    def test_max_depth(self, tmp_path):
+        """Test that folders deeper than max_depth are not scanned."""
+        _make_tree(tmp_path, {".": ["top.pdf"], "a": ["1.pdf"], "a/b": ["2.pdf"], "a/b/c": ["3.pdf"]})
+
+        structure, _ = enumerate_folder_structure(tmp_path, max_depth=2)
+        assert structure == {"root": ["top.pdf"], "a": ["1.pdf"], os.path.join("a", "b"): ["2.pdf"]}
+
+        structure, _ = enumerate_folder_structure(tmp_path, max_depth=0)
+        assert structure == {"root": ["top.pdf"]}
+
+    def test_ignore_patterns(self, tmp_path):
+        """Test that ignored folders are pruned along with everything below them."""
+        _make_tree(
+            tmp_path,
+            {".": ["top.pdf"], "keep": ["1.pdf"], "skip": ["2.pdf"], "skip/inner": ["3.pdf"]},
+        )
+
+        structure, _ = enumerate_folder_structure(tmp_path, ignore_patterns=["^skip"])
+
+        assert structure == {"root": ["top.pdf"], "keep": ["1.pdf"]}
+
+    def test_ignore_patterns_never_skip_root(self, tmp_path):
+        """Test that the root is scanned even when a pattern matches every path."""
+        _make_tree(tmp_path, {".": ["top.pdf"], "sub": ["1.pdf"]})
+
+        structure, _ = enumerate_folder_structure(tmp_path, ignore_patterns=["."])
+
+        assert structure == {"root": ["top.pdf"]}
+
+    def test_symlinks(self, tmp_path):
+        """Test that symlinked folders are not followed, while file links count as files."""
+        _make_tree(tmp_path, {"real": ["1.pdf"]})
+        (tmp_path / "dir_link").symlink_to(tmp_path / "real", target_is_directory=True)
+        (tmp_path / "file_link.pdf").symlink_to(tmp_path / "real" / "1.pdf")
+        (tmp_path / "broken_link.pdf").symlink_to(tmp_path / "missing.pdf")
+
+        structure, file_counts = enumerate_folder_structure(tmp_path)
+
+        assert sorted(structure) == ["real", "root"]
+        assert sorted(structure["root"]) == ["broken_link.pdf", "file_link.pdf"]
+        assert file_counts["root"] == 2
+
+    def test_file_counts_with_truncated_listing(self, tmp_path):
+        """Test that file_counts keeps the full count when file names are truncated."""
+        _make_tree(tmp_path, {"many": [f"{i}.pdf" for i in range(5)]})
+
+        structure, file_counts = enumerate_folder_structure(tmp_path, max_files_per_dir=2)
+
+        assert len(structure["many"]) == 2
+        assert set(structure["many"]) <= {f"{i}.pdf" for i in range(5)}
+        assert file_counts == {"many": 5}
+
+
+class TestFormatFolderInfo:
+    """Tests for formatting the scanned structure for the prompt."""
+
+    def test_keeps_largest_folders(self):
+        """Test that beyond max_folders only the largest folders are shown, sorted by name."""
+        structure = {"a": ["a1"], "b": ["b1", "b2", "b3"], "c": ["c1", "c2"]}
+        file_counts = {"a": 1, "b": 10, "c": 2}
+
+        info = format_folder_info(
+            structure, max_files_per_dir=2, max_folders=2, file_counts=file_counts
+        )
+
+        assert info == "\n".join([
+            "Folder Structure:",
+            "=" * 50,
+            "(Showing the 2 largest folders out of 3)",
+            "\nb/",
+            "  (10 files)",
+            "  - b1",
+            "  - b2",
+            "  ... and 8 more",
+            "\nc/",
+            "  (2 files)",
+            "  - c1",
+            "  - c2",
+        ])
@@ -41,7 +41,7 @@ class TestVLMService:
             pdf_pages_to_extract=3,
             vlm_max_tokens=1024,
             source_dir=None,
-            scan_ignore_patterns=[],
+            scan_ignore_patterns=(),
             default_dest_base=None,
             log_level="INFO",
         )
@@ -161,7 +161,7 @@ class TestVLMServiceIntegration:
             pdf_pages_to_extract=3,
             vlm_max_tokens=1024,
             source_dir=None,
-            scan_ignore_patterns=[],
+            scan_ignore_patterns=(),
             default_dest_base=None,
             log_level="INFO",
         )